@@ -19,12 +19,57 @@ class Settings(BaseSettings):
     ollama_host: str = "http://localhost:11434"
     ollama_model: str = "qwen3:30b"
 
-    queue_workers: int = 2
+    queue_browser_workers: int = 1
+    queue_llm_workers: int = 1
+    queue_processes: int = 1
+    queue_autoscale: bool = False
+    queue_min_workers: int = 1
+    queue_autoscale_interval: float = 10.0
+    queue_autoscale_max_wait: float = 5.0
+    queue_autoscale_idle_seconds: float = 120.0
+    queue_process_restart_delay: float = 5.0
+    queue_status_interval: float = 60.0
+    queue_metrics_port: int = 9101
+    queue_shutdown_timeout: float = 30.0
+    queue_drain_timeout: float = 15.0
     queue_poll_interval: float = 1.0
+    queue_notify_channel: str = "job_queue"
+    queue_cancel_channel: str = "job_cancel"
+    queue_fallback_poll_interval: float = 30.0
+    queue_listen_reconnect_delay: float = 5.0
+    queue_prefetch: int = 2
+    queue_claim_batch_size: int = 50
+    queue_aging_seconds: float = 300.0
+    queue_fair_share: bool = True
+    queue_lease_seconds: float = 120.0
+    queue_heartbeat_interval: float = 30.0
+    queue_reaper_interval: float = 60.0
+    queue_retry_base_seconds: float = 30.0
+    queue_retry_max_seconds: float = 1800.0
+    queue_retry_jitter: float = 0.5
+
+    job_retention_completed_days: float = 7.0
+    job_retention_failed_days: float = 30.0
+    job_retention_cancelled_days: float = 7.0
+    job_archive_retention_days: int = 365
+    job_retention_interval_minutes: int = 60
+    job_retention_batch_size: int = 5000
+    job_timeout_seconds: float = 3600.0
+    job_checkpoint_items: int = 10
+    job_checkpoint_seconds: float = 5.0
+    job_progress_interval: float = 2.0
+    job_events_channel: str = "job_events"
+    job_events_keepalive_seconds: float = 15.0
 
     tmdb_api_key: str = ""
 
     browser_headless: bool = True
+    browser_block_resources: bool = True
+    browser_max_pages: int = 200
+    browser_max_memory_mb: int = 2048
+    scrape_ready_timeout: float = 15.0
+    scrape_http_detail: bool = True
+    scrape_http_timeout: float = 15.0
 
     shared_dir: Path = Path("/app/data/shared")
 
@@ -1,6 +1,7 @@
 from .item_type import ItemType
 from .job_status import JobStatus
 from .job_type import JobType
+from .resource_class import ResourceClass
 from .scraped_type import ScrapedType
 from .show_type import ShowType
 from .validation_status import ValidationStatus
@@ -9,6 +10,7 @@ __all__ = [
     "ItemType",
     "JobStatus",
     "JobType",
+    "ResourceClass",
     "ScrapedType",
     "ShowType",
     "ValidationStatus",
@@ -2,7 +2,9 @@ from enum import StrEnum
 
 
 class JobStatus(StrEnum):
+    BLOCKED = "blocked"
     PENDING = "pending"
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class ResourceClass(StrEnum):
+    BROWSER = "browser"
+    LLM = "llm"
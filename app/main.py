@@ -3,12 +3,19 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from app.routers import health, jobs, scraped_show, shows, tmdb
+from app.core.config import settings
+from app.routers import health, jobs, metrics, scraped_show, shows, tmdb
+from app.services.browser_pool import browser_pool
+from app.workers.notifier import QueueNotifier
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    app.state.job_events = QueueNotifier(settings.job_events_channel)
+    await app.state.job_events.start()
     yield
+    await app.state.job_events.stop()
+    await browser_pool.close()
 
 
 app = FastAPI(
@@ -20,6 +27,7 @@ app = FastAPI(
 
 app.include_router(health.router)
 app.include_router(jobs.router)
+app.include_router(metrics.router)
 app.include_router(scraped_show.router)
 app.include_router(shows.router)
 app.include_router(tmdb.router)
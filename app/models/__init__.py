@@ -1,5 +1,7 @@
 from .base import Base
 from .job import Job
+from .job_archive import JobArchive
+from .job_dependency import JobDependency
 from .scraped_popular_show import ScrapedPopularShow
 from .scraped_show import ScrapedShow
 from .scraped_top_show import ScrapedTopShow
@@ -7,6 +9,8 @@ from .scraped_top_show import ScrapedTopShow
 __all__ = [
     "Base",
     "Job",
+    "JobArchive",
+    "JobDependency",
     "ScrapedPopularShow",
     "ScrapedShow",
     "ScrapedTopShow",
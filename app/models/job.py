@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Index, String, Text, func
+from sqlalchemy import Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -8,6 +8,10 @@ from app.enums import JobStatus, JobType
 
 from .base import Base
 
+ACTIVE_DEDUP_KEY_WHERE = text(
+    "dedup_key IS NOT NULL AND status IN ('blocked', 'pending', 'processing')"
+)
+
 
 class Job(Base):
     __tablename__ = "jobs"
@@ -26,5 +30,23 @@ class Job(Base):
     started_at: Mapped[datetime | None] = mapped_column(nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
     scheduled_for: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+    rank_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+    lease_expires_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    dedup_key: Mapped[str | None] = mapped_column(String, nullable=True)
+    progress: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    pending_dependencies: Mapped[int] = mapped_column(nullable=False, default=0, server_default="0")
 
-    __table_args__ = (Index("ix_jobs_pending_priority", "status", "priority", "scheduled_for"),)
+    __table_args__ = (
+        Index(
+            "ix_jobs_pending_rank",
+            "job_type",
+            "rank_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index(
+            "uq_jobs_active_dedup_key",
+            "dedup_key",
+            unique=True,
+            postgresql_where=ACTIVE_DEDUP_KEY_WHERE,
+        ),
+    )
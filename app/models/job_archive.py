@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import Index, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.enums import JobStatus, JobType
+
+from .base import Base
+
+
+class JobArchive(Base):
+    __tablename__ = "jobs_archive"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    finished_at: Mapped[datetime] = mapped_column(primary_key=True)
+    job_type: Mapped[JobType] = mapped_column(String, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    status: Mapped[JobStatus] = mapped_column(String, nullable=False)
+    priority: Mapped[int] = mapped_column(nullable=False)
+    attempts: Mapped[int] = mapped_column(nullable=False)
+    max_attempts: Mapped[int] = mapped_column(nullable=False)
+    result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    progress: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    worker_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    dedup_key: Mapped[str | None] = mapped_column(String, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    archived_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_jobs_archive_job_type_finished_at", "job_type", "finished_at"),
+        {"postgresql_partition_by": "RANGE (finished_at)"},
+    )
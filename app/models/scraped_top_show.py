@@ -17,6 +17,7 @@ class ScrapedTopShow(Base):
     position: Mapped[int] = mapped_column(nullable=False)
     show_type: Mapped[ShowType] = mapped_column(String, nullable=False)
     batch_sequence: Mapped[int] = mapped_column(nullable=False)
+    job_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     details: Mapped[dict] = mapped_column(JSONB, nullable=False)
     validation_status: Mapped[ValidationStatus] = mapped_column(
         String, nullable=False, server_default=ValidationStatus.NOT_STARTED.value
@@ -24,4 +25,7 @@ class ScrapedTopShow(Base):
     confidence: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
 
-    __table_args__ = (Index("ix_scraped_top_shows_batch_sequence", "batch_sequence"),)
+    __table_args__ = (
+        Index("ix_scraped_top_shows_batch_sequence", "batch_sequence"),
+        Index("ix_scraped_top_shows_job_id", "job_id"),
+    )
@@ -1,10 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+import time
+from collections.abc import AsyncGenerator
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import async_session_factory, get_db
 from app.enums import JobStatus
-from app.schemas.job import JobCreate, JobListResponse, JobResponse
+from app.schemas.job import (
+    JobBatchCreate,
+    JobBatchResponse,
+    JobCreate,
+    JobListResponse,
+    JobProgressEvent,
+    JobResponse,
+)
 from app.services.queue_service import QueueService
+from app.workers.notifier import QueueNotifier
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -15,15 +29,43 @@ async def create_job(
     db: AsyncSession = Depends(get_db),
 ) -> JobResponse:
     service = QueueService(db)
-    job = await service.enqueue(
-        job_type=request.job_type,
-        payload=request.payload,
-        priority=request.priority,
-        delay_seconds=request.delay_seconds,
-    )
+    try:
+        job = await service.enqueue(
+            job_type=request.job_type,
+            payload=request.payload,
+            priority=request.priority,
+            delay_seconds=request.delay_seconds,
+            dedup_key=request.dedup_key,
+            depends_on=request.depends_on,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    if job is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"An active job with dedup key '{request.dedup_key}' already exists",
+        )
+
     return JobResponse.model_validate(job)
 
 
+@router.post("/batch", response_model=JobBatchResponse)
+async def create_jobs(
+    request: JobBatchCreate,
+    db: AsyncSession = Depends(get_db),
+) -> JobBatchResponse:
+    service = QueueService(db)
+    try:
+        jobs = await service.enqueue_many(request.jobs)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return JobBatchResponse(
+        items=[JobResponse.model_validate(job) for job in jobs],
+        skipped=len(request.jobs) - len(jobs),
+    )
+
+
 @router.get("", response_model=JobListResponse)
 async def list_jobs(
     status: JobStatus | None = None,
@@ -49,6 +91,81 @@ async def get_job(
     return JobResponse.model_validate(job)
 
 
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: int,
+    request: Request,
+) -> StreamingResponse:
+    # A get_db session would stay checked out until the stream ends, so the
+    # existence check uses its own short-lived session.
+    async with async_session_factory() as session:
+        job = await QueueService(session).get_job(job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return StreamingResponse(
+        _job_events(job_id, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _job_events(job_id: int, request: Request) -> AsyncGenerator[str]:
+    # Workers NOTIFY the job id whenever progress is flushed or the job
+    # finishes, so the stream only re-reads the row when something changed.
+    notifier: QueueNotifier = request.app.state.job_events
+    wakeup = notifier.subscribe({str(job_id)})
+    last_sent: str | None = None
+    keepalive_at = time.monotonic() + settings.job_events_keepalive_seconds
+    try:
+        while not await request.is_disconnected():
+            wakeup.clear()
+            async with async_session_factory() as session:
+                job = await QueueService(session).get_job(job_id)
+
+            if job is None:
+                yield "event: deleted\ndata: {}\n\n"
+                return
+
+            data = JobProgressEvent.model_validate(job).model_dump_json()
+            if data != last_sent:
+                last_sent = data
+                keepalive_at = time.monotonic() + settings.job_events_keepalive_seconds
+                yield f"event: progress\ndata: {data}\n\n"
+
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+                yield f"event: done\ndata: {data}\n\n"
+                return
+
+            # Without LISTEN the row is polled on the short interval, but the
+            # keepalive still only goes out once the stream has been idle.
+            timeout = min(notifier.wait_timeout, max(keepalive_at - time.monotonic(), 0))
+            if not await notifier.wait(wakeup, timeout) and time.monotonic() >= keepalive_at:
+                keepalive_at = time.monotonic() + settings.job_events_keepalive_seconds
+                yield ": keepalive\n\n"
+    finally:
+        notifier.unsubscribe(wakeup)
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> JobResponse:
+    service = QueueService(db)
+    job = await service.get_job(job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    cancelled = await service.cancel_job(job_id)
+    if cancelled is None:
+        raise HTTPException(status_code=409, detail=f"Job is already {job.status}")
+
+    return JobResponse.model_validate(cancelled)
+
+
 @router.post("/{job_id}/retry", response_model=JobResponse)
 async def retry_job(
     job_id: int,
@@ -60,6 +177,18 @@ async def retry_job(
     if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    await service.retry_job(job_id)
-    job = await service.get_job(job_id)
-    return JobResponse.model_validate(job)
+    try:
+        retried = await service.retry_job(job_id)
+    except IntegrityError as e:
+        raise HTTPException(
+            status_code=409,
+            detail=f"An active job with dedup key '{job.dedup_key}' already exists",
+        ) from e
+
+    if retried is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Only failed or cancelled jobs can be retried, job is {job.status}",
+        )
+
+    return JobResponse.model_validate(retried)
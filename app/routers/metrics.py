@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Depends, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.services.metrics_service import MetricsService
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics(db: AsyncSession = Depends(get_db)) -> Response:
+    content = await MetricsService(db).render()
+    return Response(content=content, media_type=CONTENT_TYPE_LATEST)
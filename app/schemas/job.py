@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.enums import JobStatus, JobType
 
@@ -12,6 +12,14 @@ class JobCreate(BaseModel):
     payload: dict = {}
     priority: int = 0
     delay_seconds: int = 0
+    dedup_key: str | None = None
+    depends_on: list[int] = []
+
+
+class JobBatchCreate(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    jobs: list[JobCreate] = Field(min_length=1, max_length=10000)
 
 
 class JobResponse(BaseModel):
@@ -25,15 +33,44 @@ class JobResponse(BaseModel):
     attempts: int
     max_attempts: int
     result: dict | None
+    progress: dict | None
     error: str | None
     worker_id: str | None
     created_at: datetime
     started_at: datetime | None
     completed_at: datetime | None
     scheduled_for: datetime
+    lease_expires_at: datetime | None
+    dedup_key: str | None
+    pending_dependencies: int
+
+
+class JobProgressEvent(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+
+    id: int
+    status: JobStatus
+    attempts: int
+    progress: dict | None
+    error: str | None
+
+
+class JobTypeBacklog(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    job_type: JobType
+    pending: int
+    oldest_pending_seconds: float
 
 
 class JobListResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     items: list[JobResponse]
+
+
+class JobBatchResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    items: list[JobResponse]
+    skipped: int
@@ -0,0 +1,193 @@
+import asyncio
+import contextlib
+import logging
+import os
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def browser_memory_mb() -> float:
+    # Resident memory of every process started below this one (the Playwright
+    # driver and all Chromium processes). Linux only; 0 elsewhere.
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return 0.0
+
+    children: dict[int, list[int]] = defaultdict(list)
+    rss_pages: dict[int, int] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            statm = (entry / "statm").read_text()
+        except OSError:
+            continue
+        # The command name in /proc/<pid>/stat is parenthesised and may contain
+        # spaces, so the parent pid is read after its closing bracket.
+        parent = int(stat.rsplit(")", 1)[-1].split()[1])
+        children[parent].append(int(entry.name))
+        rss_pages[int(entry.name)] = int(statm.split()[1])
+
+    total = 0
+    frontier = list(children[os.getpid()])
+    while frontier:
+        pid = frontier.pop()
+        total += rss_pages.get(pid, 0)
+        frontier.extend(children[pid])
+    return total * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class PooledBrowser:
+    def __init__(self, browser: Browser, generation: int):
+        self.browser = browser
+        self.generation = generation
+        self.pages = 0
+        self.contexts = 0
+        self.retired = False
+
+    @property
+    def is_connected(self) -> bool:
+        return self.browser.is_connected()
+
+
+class BrowserPool:
+    def __init__(self):
+        self._playwright: Playwright | None = None
+        self._current: PooledBrowser | None = None
+        self._lock = asyncio.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._generation = 0
+
+    @contextlib.asynccontextmanager
+    async def context(self) -> AsyncIterator[BrowserContext]:
+        pooled, context = await self._new_context()
+        pooled.contexts += 1
+        context.on("page", lambda _: self._count_page(pooled))
+        try:
+            yield context
+        finally:
+            # Runs while a cancelled or timed-out job unwinds, so a failing close
+            # must not leak the context.
+            with contextlib.suppress(Exception):
+                await context.close()
+            pooled.contexts -= 1
+            if pooled.retired and pooled.contexts == 0:
+                await self._close_browser(pooled)
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._current is not None:
+                await self._close_browser(self._current)
+                self._current = None
+            if self._playwright is not None:
+                with contextlib.suppress(Exception):
+                    await self._playwright.stop()
+                self._playwright = None
+
+    async def _new_context(self) -> tuple[PooledBrowser, BrowserContext]:
+        pooled = await self._acquire()
+        try:
+            return pooled, await self._open_context(pooled)
+        except Exception:
+            if pooled.is_connected:
+                raise
+        # The browser crashed between launch and use; _acquire replaces it.
+        pooled = await self._acquire()
+        return pooled, await self._open_context(pooled)
+
+    async def _open_context(self, pooled: PooledBrowser) -> BrowserContext:
+        return await pooled.browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={"width": 1920, "height": 1080},
+            locale="en-US",
+        )
+
+    async def _acquire(self) -> PooledBrowser:
+        # Playwright objects belong to the loop that created them. A new loop
+        # (e.g. a second asyncio.run in the same process) starts from scratch.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._playwright = None
+            self._current = None
+
+        async with self._lock:
+            current = self._current
+            if current is not None and not current.is_connected:
+                logger.warning(
+                    f"[BrowserPool] Browser #{current.generation} disconnected, relaunching"
+                )
+                current = None
+            elif current is not None and self._needs_recycle(current):
+                await self._retire(current)
+                current = None
+
+            if current is None:
+                current = await self._launch()
+                self._current = current
+            return current
+
+    def _needs_recycle(self, pooled: PooledBrowser) -> bool:
+        if settings.browser_max_pages and pooled.pages >= settings.browser_max_pages:
+            logger.info(
+                f"[BrowserPool] Recycling browser #{pooled.generation} after {pooled.pages} pages"
+            )
+            return True
+
+        if settings.browser_max_memory_mb:
+            memory = browser_memory_mb()
+            if memory >= settings.browser_max_memory_mb:
+                logger.info(
+                    f"[BrowserPool] Recycling browser #{pooled.generation} at {memory:.0f} MB"
+                )
+                return True
+        return False
+
+    async def _retire(self, pooled: PooledBrowser) -> None:
+        # Contexts still running on the old browser keep it alive; the last one
+        # to close shuts it down.
+        pooled.retired = True
+        if pooled.contexts == 0:
+            await self._close_browser(pooled)
+
+    async def _launch(self) -> PooledBrowser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        try:
+            browser = await self._playwright.chromium.launch(headless=settings.browser_headless)
+        except Exception:
+            # A dead driver cannot launch anything, so start Playwright over once.
+            with contextlib.suppress(Exception):
+                await self._playwright.stop()
+            self._playwright = await async_playwright().start()
+            browser = await self._playwright.chromium.launch(headless=settings.browser_headless)
+
+        self._generation += 1
+        logger.info(f"[BrowserPool] Launched browser #{self._generation}")
+        return PooledBrowser(browser, self._generation)
+
+    async def _close_browser(self, pooled: PooledBrowser) -> None:
+        with contextlib.suppress(Exception):
+            await pooled.browser.close()
+        logger.info(f"[BrowserPool] Closed browser #{pooled.generation} ({pooled.pages} pages)")
+
+    def _count_page(self, pooled: PooledBrowser) -> None:
+        pooled.pages += 1
+
+
+browser_pool = BrowserPool()
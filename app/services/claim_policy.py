@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import ColumnElement, case, func
+
+from app.core.config import settings
+from app.enums import JobType
+
+JOB_TYPE_WEIGHTS: dict[JobType, float] = {
+    JobType.SCRAPE_TOP_TEN: 1.0,
+    JobType.SCRAPE_POPULAR: 1.0,
+    JobType.VALIDATE_AND_STORE: 2.0,
+}
+
+
+def get_job_type_weight(job_type: JobType) -> float:
+    return JOB_TYPE_WEIGHTS.get(job_type, 1.0)
+
+
+def job_type_weight_sql(job_type: ColumnElement[str]) -> ColumnElement[float]:
+    return case(
+        *((job_type == jt.value, weight) for jt, weight in JOB_TYPE_WEIGHTS.items()),
+        else_=1.0,
+    )
+
+
+# A job's effective priority is priority + waited / QUEUE_AGING_SECONDS. Ordering
+# by that is the same as ordering by scheduled_for - priority * QUEUE_AGING_SECONDS
+# ascending, which does not depend on the current time and so can be stored and
+# indexed as rank_at.
+def rank_at(scheduled_for: datetime, priority: int) -> datetime:
+    return scheduled_for - timedelta(seconds=priority * settings.queue_aging_seconds)
+
+
+def rank_at_sql(
+    scheduled_for: ColumnElement[datetime], priority: ColumnElement[int]
+) -> ColumnElement[datetime]:
+    return scheduled_for - func.make_interval(
+        0, 0, 0, 0, 0, 0, priority * settings.queue_aging_seconds
+    )
@@ -0,0 +1,42 @@
+from prometheus_client import Gauge, generate_latest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import JobStatus, JobType
+from app.services.queue_service import QueueService
+
+QUEUE_JOBS = Gauge(
+    "streamvault_queue_jobs",
+    "Jobs in the jobs table by status and job type",
+    ["status", "job_type"],
+)
+QUEUE_OLDEST_PENDING_SECONDS = Gauge(
+    "streamvault_queue_oldest_pending_seconds",
+    "Seconds the oldest due pending job of each type has been waiting",
+    ["job_type"],
+)
+
+
+class MetricsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def render(self) -> bytes:
+        queue = QueueService(self.db)
+        counts = await queue.get_status_counts()
+        backlog = await queue.get_backlog()
+
+        # Every status/type pair is exported, so an emptied queue reads as 0
+        # instead of the series disappearing.
+        for job_type in JobType:
+            QUEUE_OLDEST_PENDING_SECONDS.labels(job_type.value).set(0)
+            for status in JobStatus:
+                QUEUE_JOBS.labels(status.value, job_type.value).set(0)
+
+        for status, job_type, count in counts:
+            QUEUE_JOBS.labels(status, job_type).set(count)
+        for entry in backlog:
+            QUEUE_OLDEST_PENDING_SECONDS.labels(entry.job_type.value).set(
+                entry.oldest_pending_seconds
+            )
+
+        return generate_latest()
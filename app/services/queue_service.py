@@ -1,10 +1,38 @@
+import hashlib
+import json
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, update
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    String,
+    Subquery,
+    case,
+    column,
+    func,
+    select,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.enums import JobStatus, JobType
-from app.models import Job
+from app.models import Job, JobDependency
+from app.models.job import ACTIVE_DEDUP_KEY_WHERE
+from app.schemas.job import JobCreate, JobTypeBacklog
+from app.services.claim_policy import job_type_weight_sql, rank_at, rank_at_sql
+from app.services.retry_policy import RETRY_POLICIES, RetryPolicy, get_retry_policy
+
+ACTIVE_STATUSES = [JobStatus.BLOCKED, JobStatus.PENDING, JobStatus.PROCESSING]
+TERMINAL_FAILURES = [JobStatus.FAILED, JobStatus.CANCELLED]
+
+
+def make_dedup_key(job_type: JobType, payload: dict | None = None) -> str:
+    canonical = json.dumps(payload or {}, sort_keys=True, separators=(",", ":"))
+    return f"{job_type.value}:{hashlib.sha256(canonical.encode()).hexdigest()[:32]}"
 
 
 class QueueService:
@@ -17,21 +45,125 @@ class QueueService:
         payload: dict | None = None,
         priority: int = 0,
         delay_seconds: int = 0,
-    ) -> Job:
+        dedup_key: str | None = None,
+        depends_on: list[int] | None = None,
+    ) -> Job | None:
+        row = self._job_row(job_type, payload, priority, delay_seconds, dedup_key)
+        if depends_on:
+            row.update(await self._dependency_state(depends_on))
+
+        stmt = self._insert_stmt().values(**row).returning(Job)
+        job = (await self.db.execute(stmt)).scalar_one_or_none()
+        if job is None:
+            return None
+
+        if depends_on:
+            edges = [{"job_id": job.id, "depends_on_id": parent} for parent in set(depends_on)]
+            await self.db.execute(insert(JobDependency), edges)
+        if job.status == JobStatus.PENDING:
+            await self._notify(job_type)
+        return job
+
+    async def enqueue_many(self, jobs: list[JobCreate]) -> list[Job]:
+        independent = [job for job in jobs if not job.depends_on]
+        created: list[Job] = []
+
+        # Jobs with dependencies need their parents locked and edges written,
+        # so only the independent ones go through the bulk insert.
+        for job in jobs:
+            if job.depends_on:
+                dependent = await self.enqueue(
+                    job.job_type,
+                    job.payload,
+                    job.priority,
+                    job.delay_seconds,
+                    job.dedup_key,
+                    job.depends_on,
+                )
+                if dependent is not None:
+                    created.append(dependent)
+
+        if not independent:
+            return created
+
+        rows = [
+            self._job_row(job.job_type, job.payload, job.priority, job.delay_seconds, job.dedup_key)
+            for job in independent
+        ]
+        # One executemany: asyncpg receives the rows as batched multi-row
+        # INSERT ... RETURNING statements rather than one round-trip per job.
+        result = await self.db.scalars(self._insert_stmt().returning(Job), rows)
+        inserted = list(result.all())
+
+        for job_type in {job.job_type for job in inserted}:
+            await self._notify(JobType(job_type))
+        return created + inserted
+
+    async def get_active_job(self, dedup_key: str) -> Job | None:
+        stmt = select(Job).where(Job.dedup_key == dedup_key, Job.status.in_(ACTIVE_STATUSES))
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _dependency_state(self, depends_on: list[int]) -> dict:
+        # FOR SHARE conflicts with the UPDATE that completes a parent: either the
+        # parent finishes first and is seen as completed here, or its release
+        # runs after this job and its edges are committed.
+        stmt = select(Job.id, Job.status).where(Job.id.in_(depends_on)).with_for_update(read=True)
+        statuses = {job_id: JobStatus(status) for job_id, status in await self.db.execute(stmt)}
+
+        missing = set(depends_on) - statuses.keys()
+        if missing:
+            raise ValueError(f"Unknown dependency job id(s): {sorted(missing)}")
+
+        broken = [job_id for job_id, status in statuses.items() if status in TERMINAL_FAILURES]
+        if broken:
+            return {
+                "status": JobStatus.CANCELLED,
+                "error": f"Dependency job(s) {sorted(broken)} did not complete",
+                "completed_at": datetime.now(),
+            }
+
+        remaining = sum(1 for status in statuses.values() if status != JobStatus.COMPLETED)
+        if remaining:
+            return {"status": JobStatus.BLOCKED, "pending_dependencies": remaining}
+        return {}
+
+    def _job_row(
+        self,
+        job_type: JobType,
+        payload: dict | None,
+        priority: int,
+        delay_seconds: int,
+        dedup_key: str | None,
+    ) -> dict:
         scheduled_for = datetime.now()
         if delay_seconds > 0:
             scheduled_for = scheduled_for + timedelta(seconds=delay_seconds)
 
-        job = Job(
-            job_type=job_type,
-            payload=payload or {},
-            priority=priority,
-            scheduled_for=scheduled_for,
+        return {
+            "job_type": job_type,
+            "payload": payload or {},
+            "priority": priority,
+            "scheduled_for": scheduled_for,
+            "rank_at": rank_at(scheduled_for, priority),
+            "dedup_key": dedup_key,
+        }
+
+    def _insert_stmt(self) -> Insert:
+        # With a dedup key the partial unique index turns a second pending or
+        # processing job with the same key into a no-op, and nothing is returned.
+        return insert(Job).on_conflict_do_nothing(
+            index_elements=[Job.dedup_key],
+            index_where=ACTIVE_DEDUP_KEY_WHERE,
         )
-        self.db.add(job)
-        await self.db.flush()
-        await self.db.refresh(job)
-        return job
+
+    async def _notify(self, job_type: JobType) -> None:
+        stmt = select(func.pg_notify(settings.queue_notify_channel, job_type.value))
+        await self.db.execute(stmt)
+
+    async def _notify_job_event(self, job_id: int) -> None:
+        stmt = select(func.pg_notify(settings.job_events_channel, str(job_id)))
+        await self.db.execute(stmt)
 
     async def get_job(self, job_id: int) -> Job | None:
         stmt = select(Job).where(Job.id == job_id)
@@ -49,70 +181,376 @@ class QueueService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def claim_job(self, worker_id: str) -> Job | None:
+    async def get_backlog(self) -> list[JobTypeBacklog]:
+        now = datetime.now()
         stmt = (
-            select(Job)
-            .where(Job.status == JobStatus.PENDING, Job.scheduled_for <= datetime.now())
-            .order_by(Job.priority.desc(), Job.created_at.asc())
-            .limit(1)
-            .with_for_update(skip_locked=True)
+            select(Job.job_type, func.count(), func.min(Job.scheduled_for))
+            .where(Job.status == JobStatus.PENDING, Job.scheduled_for <= now)
+            .group_by(Job.job_type)
+        )
+        rows = (await self.db.execute(stmt)).all()
+        return [
+            JobTypeBacklog(
+                job_type=JobType(job_type),
+                pending=pending,
+                oldest_pending_seconds=(now - oldest).total_seconds(),
+            )
+            for job_type, pending, oldest in rows
+        ]
+
+    async def get_status_counts(self) -> list[tuple[str, str, int]]:
+        stmt = select(Job.status, Job.job_type, func.count()).group_by(Job.status, Job.job_type)
+        return [tuple(row) for row in (await self.db.execute(stmt)).all()]
+
+    async def claim_job(self, worker_id: str, job_types: list[JobType] | None = None) -> Job | None:
+        jobs = await self.claim_jobs(worker_id, 1, job_types)
+        return jobs[0] if jobs else None
+
+    async def claim_jobs(
+        self, worker_id: str, n: int, job_types: list[JobType] | None = None
+    ) -> list[Job]:
+        if n <= 0:
+            return []
+
+        now = datetime.now()
+        candidates = self._claim_candidates(now, n, job_types or list(JobType))
+        stmt = (
+            update(Job)
+            .where(Job.id == candidates.c.id)
+            .values(
+                status=JobStatus.PROCESSING,
+                worker_id=worker_id,
+                started_at=now,
+                attempts=Job.attempts + 1,
+                lease_expires_at=self._lease_deadline(),
+            )
+            .returning(Job)
+            .execution_options(synchronize_session=False)
         )
 
         result = await self.db.execute(stmt)
-        job = result.scalar_one_or_none()
+        jobs = list(result.scalars().all())
+        jobs.sort(key=lambda job: job.rank_at)
+        return jobs
 
-        if job is None:
-            return None
+    def _claim_candidates(self, now: datetime, n: int, job_types: list[JobType]) -> CTE:
+        # Each job type contributes its n oldest-ranked due jobs, read off the
+        # partial (job_type, rank_at) index. rank_at already folds priority
+        # aging into a single sortable timestamp.
+        types = values(column("job_type", String), name="claim_types").data(
+            [(job_type.value,) for job_type in job_types]
+        )
+        per_type = (
+            select(Job.id, Job.job_type, Job.rank_at)
+            .where(
+                Job.status == JobStatus.PENDING,
+                Job.job_type == types.c.job_type,
+                Job.scheduled_for <= now,
+            )
+            .order_by(Job.rank_at)
+            .limit(n)
+            .lateral("per_type")
+        )
 
-        job.status = JobStatus.PROCESSING
-        job.worker_id = worker_id
-        job.started_at = datetime.now()
-        job.attempts += 1
+        if not settings.queue_fair_share:
+            ranked = (
+                select(per_type.c.id, per_type.c.rank_at)
+                .select_from(types.join(per_type, true()))
+                .subquery("ranked")
+            )
+            return self._lock_candidates(ranked, n, ranked.c.rank_at)
 
-        await self.db.flush()
-        return job
+        # Weighted fair share: the k-th candidate of a type is served at
+        # (running jobs of that type + k) / weight, so types interleave in
+        # proportion to their weights and a flood of one type cannot starve
+        # the others.
+        running = (
+            select(Job.job_type, func.count().label("running"))
+            .where(Job.status == JobStatus.PROCESSING)
+            .group_by(Job.job_type)
+            .subquery("running")
+        )
+        turn = func.row_number().over(partition_by=per_type.c.job_type, order_by=per_type.c.rank_at)
+        share = (func.coalesce(running.c.running, 0) + turn) / job_type_weight_sql(
+            per_type.c.job_type
+        )
+        ranked = (
+            select(per_type.c.id, share.label("share"), per_type.c.rank_at)
+            .select_from(
+                types.join(per_type, true()).outerjoin(
+                    running, running.c.job_type == per_type.c.job_type
+                )
+            )
+            .subquery("ranked")
+        )
+        return self._lock_candidates(ranked, n, ranked.c.share, ranked.c.rank_at)
+
+    def _lock_candidates(self, ranked: Subquery, n: int, *order_by: ColumnElement) -> CTE:
+        # Candidates are ranked without locks and only the n that are claimed
+        # get locked, so the extra rows each type contributed stay claimable
+        # by concurrent workers. Rows are locked as the LIMIT pulls them, rows
+        # another claim holds are skipped, and a row claimed since it was read
+        # fails the status recheck.
+        return (
+            select(Job.id)
+            .join(ranked, Job.id == ranked.c.id)
+            .where(Job.status == JobStatus.PENDING)
+            .order_by(*order_by)
+            .limit(n)
+            .with_for_update(of=Job, skip_locked=True)
+            .cte("candidates")
+        )
+
+    async def release_jobs(self, job_ids: list[int]) -> None:
+        if not job_ids:
+            return
+
+        stmt = (
+            update(Job)
+            .where(Job.id.in_(job_ids), Job.status == JobStatus.PROCESSING)
+            .values(
+                status=JobStatus.PENDING,
+                attempts=Job.attempts - 1,
+                worker_id=None,
+                started_at=None,
+                lease_expires_at=None,
+            )
+            .returning(Job.job_type)
+        )
+        job_types = set((await self.db.execute(stmt)).scalars().all())
+        for job_type in job_types:
+            await self._notify(JobType(job_type))
+
+    async def requeue_job(self, job: Job) -> bool:
+        # A drained job goes back to the front of its line: rank_at is unchanged
+        # and the attempt it was charged on claim is handed back.
+        stmt = (
+            update(Job)
+            .where(*self._holds_lease(job))
+            .values(
+                status=JobStatus.PENDING,
+                attempts=Job.attempts - 1,
+                worker_id=None,
+                started_at=None,
+                lease_expires_at=None,
+            )
+            .returning(Job.job_type)
+        )
+        job_type = (await self.db.execute(stmt)).scalar_one_or_none()
+        if job_type is None:
+            return False
+
+        await self._notify(JobType(job_type))
+        await self._notify_job_event(job.id)
+        return True
+
+    async def renew_lease(self, job: Job) -> bool:
+        stmt = (
+            update(Job)
+            .where(*self._holds_lease(job))
+            .values(lease_expires_at=self._lease_deadline())
+            .returning(Job.id)
+        )
+        return (await self.db.execute(stmt)).scalar_one_or_none() is not None
+
+    async def store_progress(self, job: Job, progress: dict) -> bool:
+        stmt = (
+            update(Job).where(*self._holds_lease(job)).values(progress=progress).returning(Job.id)
+        )
+        if (await self.db.execute(stmt)).scalar_one_or_none() is None:
+            return False
+        await self._notify_job_event(job.id)
+        return True
+
+    async def reap_expired_jobs(self) -> int:
+        exhausted = Job.attempts >= Job.max_attempts
+        retry_delay = case(
+            *(
+                (Job.job_type == job_type.value, policy.delay_sql(Job.attempts))
+                for job_type, policy in RETRY_POLICIES.items()
+            ),
+            else_=RetryPolicy().delay_sql(Job.attempts),
+        )
+        stmt = (
+            update(Job)
+            .where(Job.status == JobStatus.PROCESSING, Job.lease_expires_at < func.now())
+            .values(
+                status=case((exhausted, JobStatus.FAILED), else_=JobStatus.PENDING),
+                error=case(
+                    (exhausted, "Lease expired: worker stopped renewing, attempts exhausted"),
+                    else_="Lease expired: worker stopped renewing",
+                ),
+                worker_id=None,
+                lease_expires_at=None,
+                scheduled_for=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, retry_delay),
+                rank_at=rank_at_sql(func.now(), Job.priority),
+            )
+            .returning(Job.id, Job.status)
+        )
+        reaped = (await self.db.execute(stmt)).all()
+        await self._cancel_dependents(
+            [job_id for job_id, status in reaped if status == JobStatus.FAILED]
+        )
+        return len(reaped)
+
+    def _holds_lease(self, job: Job) -> list[ColumnElement[bool]]:
+        # Only the worker that claimed this attempt may renew or finish it; a
+        # stale worker whose lease was reaped and re-claimed matches nothing.
+        return [
+            Job.id == job.id,
+            Job.status == JobStatus.PROCESSING,
+            Job.worker_id == job.worker_id,
+            Job.attempts == job.attempts,
+        ]
 
-    async def complete_job(self, job_id: int, result: dict | None = None) -> None:
+    def _lease_deadline(self) -> ColumnElement[datetime]:
+        return func.now() + timedelta(seconds=settings.queue_lease_seconds)
+
+    async def complete_job(self, job: Job, result: dict | None = None) -> None:
         stmt = (
             update(Job)
-            .where(Job.id == job_id)
+            .where(*self._holds_lease(job))
             .values(
                 status=JobStatus.COMPLETED,
                 completed_at=datetime.now(),
                 result=result or {},
+                lease_expires_at=None,
             )
+            .returning(Job.id)
         )
-        await self.db.execute(stmt)
+        # Children are released only on a real transition; a stale or repeated
+        # completion must not decrement their counters a second time.
+        if (await self.db.execute(stmt)).scalar_one_or_none() is None:
+            return
+        await self._notify_job_event(job.id)
+        await self._release_dependents(job.id)
 
-    async def fail_job(self, job_id: int, error: str) -> None:
-        job = await self.get_job(job_id)
-        if job is None:
+    async def _release_dependents(self, job_id: int) -> None:
+        # Each completed parent decrements its children's counter in one UPDATE.
+        # Row locks serialise concurrent parents, so the last one always sees
+        # the counter reach zero and flips the child to pending.
+        remaining = Job.pending_dependencies - 1
+        children = select(JobDependency.job_id).where(JobDependency.depends_on_id == job_id)
+        stmt = (
+            update(Job)
+            .where(Job.id.in_(children), Job.status == JobStatus.BLOCKED)
+            .values(
+                pending_dependencies=remaining,
+                status=case((remaining <= 0, JobStatus.PENDING), else_=Job.status),
+            )
+            .returning(Job.job_type, Job.status)
+            .execution_options(synchronize_session=False)
+        )
+        released = {
+            job_type
+            for job_type, status in await self.db.execute(stmt)
+            if status == JobStatus.PENDING
+        }
+        for job_type in released:
+            await self._notify(JobType(job_type))
+
+    async def _cancel_dependents(self, job_ids: list[int]) -> None:
+        if not job_ids:
             return
 
+        descendants = (
+            select(JobDependency.job_id.label("id"))
+            .where(JobDependency.depends_on_id.in_(job_ids))
+            .cte("descendants", recursive=True)
+        )
+        descendants = descendants.union(
+            select(JobDependency.job_id).join(
+                descendants, JobDependency.depends_on_id == descendants.c.id
+            )
+        )
+        stmt = (
+            update(Job)
+            .where(Job.id.in_(select(descendants.c.id)), Job.status == JobStatus.BLOCKED)
+            .values(
+                status=JobStatus.CANCELLED,
+                error="Cancelled because a dependency did not complete",
+                completed_at=datetime.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(stmt)
+
+    async def fail_job(self, job: Job, error: str) -> None:
         new_status = JobStatus.FAILED if job.attempts >= job.max_attempts else JobStatus.PENDING
+        retry_delay = get_retry_policy(JobType(job.job_type)).delay_seconds(job.attempts)
+        scheduled_for = datetime.now() + timedelta(seconds=retry_delay)
 
         stmt = (
             update(Job)
-            .where(Job.id == job_id)
+            .where(*self._holds_lease(job))
             .values(
                 status=new_status,
                 error=error,
                 worker_id=None,
+                lease_expires_at=None,
+                scheduled_for=scheduled_for,
+                rank_at=rank_at(scheduled_for, job.priority),
+                completed_at=datetime.now() if new_status == JobStatus.FAILED else None,
             )
+            .returning(Job.id)
         )
-        await self.db.execute(stmt)
+        # A worker that lost its lease must not cancel the children of a job
+        # that another worker is still running.
+        if (await self.db.execute(stmt)).scalar_one_or_none() is None:
+            return
+        await self._notify_job_event(job.id)
+        if new_status == JobStatus.FAILED:
+            await self._cancel_dependents([job.id])
 
-    async def retry_job(self, job_id: int) -> None:
+    async def cancel_job(self, job_id: int) -> Job | None:
         stmt = (
             update(Job)
-            .where(Job.id == job_id)
+            .where(Job.id == job_id, Job.status.in_(ACTIVE_STATUSES))
             .values(
-                status=JobStatus.PENDING,
+                status=JobStatus.CANCELLED,
+                error="Cancelled by request",
+                completed_at=datetime.now(),
+                lease_expires_at=None,
+            )
+            .returning(Job)
+            .execution_options(populate_existing=True)
+        )
+        job = (await self.db.execute(stmt)).scalar_one_or_none()
+        if job is not None:
+            # The owning worker listens on the cancel channel and stops the handler.
+            cancel = select(func.pg_notify(settings.queue_cancel_channel, str(job_id)))
+            await self.db.execute(cancel)
+            await self._notify_job_event(job_id)
+            await self._cancel_dependents([job_id])
+        return job
+
+    async def retry_job(self, job_id: int) -> Job | None:
+        # Only finished failures are retried. Parents are locked as in enqueue,
+        # and a job still waiting on any of them goes back to blocked.
+        parents = select(JobDependency.depends_on_id).where(JobDependency.job_id == job_id)
+        stmt = select(Job.status).where(Job.id.in_(parents)).with_for_update(read=True)
+        statuses = (await self.db.scalars(stmt)).all()
+        remaining = sum(1 for status in statuses if status != JobStatus.COMPLETED)
+
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, Job.status.in_(TERMINAL_FAILURES))
+            .values(
+                status=JobStatus.BLOCKED if remaining else JobStatus.PENDING,
+                pending_dependencies=remaining,
                 attempts=0,
                 error=None,
                 worker_id=None,
                 started_at=None,
                 completed_at=None,
+                lease_expires_at=None,
+                scheduled_for=func.now(),
+                rank_at=rank_at_sql(func.now(), Job.priority),
             )
+            .returning(Job)
+            .execution_options(populate_existing=True)
         )
-        await self.db.execute(stmt)
+        job = (await self.db.execute(stmt)).scalar_one_or_none()
+        if job is not None and job.status == JobStatus.PENDING:
+            await self._notify(JobType(job.job_type))
+        return job
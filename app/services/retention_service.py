@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, delete, func, insert, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.enums import JobStatus
+from app.models import Job, JobArchive
+
+ARCHIVE_PARTITION_PREFIX = f"{JobArchive.__tablename__}_p"
+
+ARCHIVED_COLUMNS = [
+    "id",
+    "job_type",
+    "payload",
+    "status",
+    "priority",
+    "attempts",
+    "max_attempts",
+    "result",
+    "progress",
+    "error",
+    "worker_id",
+    "dedup_key",
+    "created_at",
+    "started_at",
+    "completed_at",
+]
+
+
+def get_retention_ttls() -> dict[JobStatus, timedelta]:
+    return {
+        JobStatus.COMPLETED: timedelta(days=settings.job_retention_completed_days),
+        JobStatus.FAILED: timedelta(days=settings.job_retention_failed_days),
+        JobStatus.CANCELLED: timedelta(days=settings.job_retention_cancelled_days),
+    }
+
+
+def month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(value: datetime) -> datetime:
+    return month_start(month_start(value) + timedelta(days=32))
+
+
+def partition_name(month: datetime) -> str:
+    return f"{ARCHIVE_PARTITION_PREFIX}{month:%Y%m}"
+
+
+class RetentionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def archive_expired_jobs(self, limit: int | None = None) -> int:
+        limit = limit or settings.job_retention_batch_size
+        now = datetime.now()
+
+        # Jobs failed before completed_at was recorded on failure fall back
+        # to the last claim.
+        finished_at = func.coalesce(Job.completed_at, Job.started_at, Job.created_at)
+        expired = or_(
+            *(
+                and_(Job.status == status, finished_at < now - ttl)
+                for status, ttl in get_retention_ttls().items()
+            )
+        )
+
+        oldest = await self.db.scalar(select(func.min(finished_at)).where(expired))
+        if oldest is None:
+            return 0
+        await self.ensure_partitions(oldest, now)
+
+        batch = (
+            select(Job.id)
+            .where(expired)
+            .order_by(Job.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        moved = (
+            delete(Job)
+            .where(Job.id.in_(select(batch.c.id)))
+            .returning(
+                finished_at.label("finished_at"),
+                *(getattr(Job, column) for column in ARCHIVED_COLUMNS),
+            )
+            .cte("moved")
+        )
+        stmt = insert(JobArchive).from_select(
+            ["finished_at", *ARCHIVED_COLUMNS],
+            select(moved.c.finished_at, *(moved.c[column] for column in ARCHIVED_COLUMNS)),
+        )
+        result = await self.db.execute(stmt)
+        return result.rowcount
+
+    async def ensure_partitions(self, start: datetime, end: datetime) -> list[str]:
+        existing = set(await self.get_partitions())
+        created = []
+
+        month = month_start(start)
+        while month <= end:
+            name = partition_name(month)
+            if name not in existing:
+                stmt = text(
+                    f"CREATE TABLE IF NOT EXISTS {name} "
+                    f"PARTITION OF {JobArchive.__tablename__} "
+                    f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month(month):%Y-%m-%d}')"
+                )
+                await self.db.execute(stmt)
+                created.append(name)
+            month = next_month(month)
+        return created
+
+    async def drop_expired_partitions(self) -> list[str]:
+        cutoff = datetime.now() - timedelta(days=settings.job_archive_retention_days)
+        dropped = []
+
+        for name in await self.get_partitions():
+            month = datetime.strptime(name.removeprefix(ARCHIVE_PARTITION_PREFIX), "%Y%m")
+            if next_month(month) <= cutoff:
+                await self.db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                dropped.append(name)
+        return dropped
+
+    async def get_partitions(self) -> list[str]:
+        stmt = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent ORDER BY child.relname"
+        )
+        result = await self.db.execute(stmt, {"parent": JobArchive.__tablename__})
+        names = result.scalars().all()
+        return [name for name in names if name.startswith(ARCHIVE_PARTITION_PREFIX)]
@@ -0,0 +1,62 @@
+import random
+
+from sqlalchemy import ColumnElement, func
+
+from app.core.config import settings
+from app.enums import JobType
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        base_seconds: float | None = None,
+        max_seconds: float | None = None,
+        jitter: float | None = None,
+    ):
+        self._base_seconds = base_seconds
+        self._max_seconds = max_seconds
+        self._jitter = jitter
+
+    # Unset fields follow the QUEUE_RETRY_* settings at the time of use.
+    @property
+    def base_seconds(self) -> float:
+        if self._base_seconds is None:
+            return settings.queue_retry_base_seconds
+        return self._base_seconds
+
+    @property
+    def max_seconds(self) -> float:
+        if self._max_seconds is None:
+            return settings.queue_retry_max_seconds
+        return self._max_seconds
+
+    @property
+    def jitter(self) -> float:
+        if self._jitter is None:
+            return settings.queue_retry_jitter
+        return self._jitter
+
+    def backoff_seconds(self, attempts: int) -> float:
+        return min(self.max_seconds, self.base_seconds * 2 ** max(attempts - 1, 0))
+
+    def delay_seconds(self, attempts: int) -> float:
+        return self.backoff_seconds(attempts) * (1 - self.jitter * random.random())
+
+    def delay_sql(self, attempts: ColumnElement[int]) -> ColumnElement[float]:
+        backoff = func.least(
+            self.max_seconds,
+            self.base_seconds * func.power(2, func.greatest(attempts - 1, 0)),
+        )
+        return backoff * (1 - self.jitter * func.random())
+
+
+# Only the fields that differ from the QUEUE_RETRY_* defaults are pinned here.
+RETRY_POLICIES: dict[JobType, RetryPolicy] = {
+    JobType.SCRAPE_TOP_TEN: RetryPolicy(base_seconds=60),
+    JobType.SCRAPE_POPULAR: RetryPolicy(base_seconds=60),
+    JobType.VALIDATE_AND_STORE: RetryPolicy(max_seconds=900),
+}
+
+
+def get_retry_policy(job_type: JobType) -> RetryPolicy:
+    return RETRY_POLICIES.get(job_type) or RetryPolicy()
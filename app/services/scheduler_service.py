@@ -2,10 +2,14 @@ import logging
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
+from app.core.config import settings
 from app.core.database import async_session_factory
 from app.enums import JobType
-from app.services.queue_service import QueueService
+from app.models import Job
+from app.services.queue_service import QueueService, make_dedup_key
+from app.services.retention_service import RetentionService
 
 logger = logging.getLogger(__name__)
 
@@ -17,45 +21,91 @@ class SchedulerService:
 
     def _setup_jobs(self) -> None:
         self.scheduler.add_job(
-            self._enqueue_job,
+            self._enqueue_pipeline,
             CronTrigger(hour="6,15", minute=0),
-            args=[JobType.SCRAPE_TOP_TEN, {}],
-            id="scrape_top_ten",
+            id="scrape_and_validate",
         )
         self.scheduler.add_job(
-            self._enqueue_job,
-            CronTrigger(hour="6,15", minute=30),
-            args=[JobType.SCRAPE_POPULAR, {"url": "https://www.justwatch.com/us/movies"}],
-            id="scrape_popular_movies",
-        )
-        self.scheduler.add_job(
-            self._enqueue_job,
-            CronTrigger(hour="7,16", minute=0),
-            args=[JobType.SCRAPE_POPULAR, {"url": "https://www.justwatch.com/us/tv-shows"}],
-            id="scrape_popular_series",
-        )
-        self.scheduler.add_job(
-            self._enqueue_job,
-            CronTrigger(hour="7,16", minute=30),
-            args=[JobType.VALIDATE_AND_STORE, {"source_table": "top_shows"}],
-            id="validate_top_shows",
-        )
-        self.scheduler.add_job(
-            self._enqueue_job,
-            CronTrigger(hour="8,17", minute=0),
-            args=[JobType.VALIDATE_AND_STORE, {"source_table": "popular_shows"}],
-            id="validate_popular_shows",
+            self._run_retention,
+            IntervalTrigger(minutes=settings.job_retention_interval_minutes),
+            id="job_retention",
         )
 
-    async def _enqueue_job(self, job_type: JobType, payload: dict) -> None:
+    async def _enqueue_pipeline(self) -> None:
         try:
             async with async_session_factory() as session:
                 queue = QueueService(session)
-                job = await queue.enqueue(job_type, payload)
+                top_ten = await self._enqueue_job(queue, JobType.SCRAPE_TOP_TEN, {})
+                movies = await self._enqueue_job(
+                    queue, JobType.SCRAPE_POPULAR, {"url": "https://www.justwatch.com/us/movies"}
+                )
+                series = await self._enqueue_job(
+                    queue, JobType.SCRAPE_POPULAR, {"url": "https://www.justwatch.com/us/tv-shows"}
+                )
+                await self._enqueue_job(
+                    queue,
+                    JobType.VALIDATE_AND_STORE,
+                    {"source_table": "top_shows"},
+                    depends_on=[top_ten],
+                )
+                await self._enqueue_job(
+                    queue,
+                    JobType.VALIDATE_AND_STORE,
+                    {"source_table": "popular_shows"},
+                    depends_on=[movies, series],
+                )
+                await session.commit()
+        except Exception as e:
+            logger.exception("Failed to enqueue scheduled pipeline: %s", e)
+
+    async def _enqueue_job(
+        self,
+        queue: QueueService,
+        job_type: JobType,
+        payload: dict,
+        depends_on: list[Job | None] | None = None,
+    ) -> Job | None:
+        dedup_key = make_dedup_key(job_type, payload)
+        parents = [parent.id for parent in depends_on or [] if parent is not None]
+        job = await queue.enqueue(job_type, payload, dedup_key=dedup_key, depends_on=parents)
+        if job is None:
+            # An identical job is still active; later stages wait on that one instead.
+            job = await queue.get_active_job(dedup_key)
+            logger.info(
+                "Scheduled job skipped, identical job still active: %s (id=%s)",
+                job_type.value,
+                job.id if job else None,
+            )
+            return job
+
+        logger.info(
+            "Scheduled job enqueued: %s (id=%s, status=%s)", job_type.value, job.id, job.status
+        )
+        return job
+
+    async def _run_retention(self) -> None:
+        try:
+            archived = 0
+            while True:
+                async with async_session_factory() as session:
+                    moved = await RetentionService(session).archive_expired_jobs()
+                    await session.commit()
+                archived += moved
+                if moved < settings.job_retention_batch_size:
+                    break
+
+            async with async_session_factory() as session:
+                dropped = await RetentionService(session).drop_expired_partitions()
                 await session.commit()
-                logger.info("Scheduled job enqueued: %s (id=%s)", job_type.value, job.id)
+
+            if archived or dropped:
+                logger.info(
+                    "Job retention archived %d job(s), dropped partitions: %s",
+                    archived,
+                    ", ".join(dropped) or "none",
+                )
         except Exception as e:
-            logger.exception("Failed to enqueue scheduled job %s: %s", job_type.value, e)
+            logger.exception("Job retention failed: %s", e)
 
     def start(self) -> None:
         self.scheduler.start()
@@ -1,19 +1,21 @@
 import asyncio
 import contextlib
 import logging
-from collections.abc import Awaitable, Callable
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
 from pathlib import Path
 from typing import TypeVar
 
 import httpx
-from playwright.async_api import BrowserContext, Page, Playwright, async_playwright
-from playwright.async_api._generated import Browser
+from playwright.async_api import BrowserContext, Page, Route
 from pydantic import BaseModel
 
 from app.core.config import settings
 from app.schemas.scrape import ScrapeCastMember, ScrapeShow, ScrapeShowList
+from app.services.browser_pool import USER_AGENT, browser_pool
 from app.services.llm_service import LLMService
 from app.services.site_origins.base import SiteOrigin, TopTenResult
+from app.services.site_origins.readiness import Readiness, wait_until_ready
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +23,13 @@ T = TypeVar("T", bound=BaseModel)
 
 
 class ScraperService:
-    def __init__(self, llm_service: LLMService | None = None):
+    def __init__(
+        self,
+        llm_service: LLMService | None = None,
+        on_page_ready: Callable[[str, str, float], None] | None = None,
+    ):
         self.llm = llm_service or LLMService()
+        self.on_page_ready = on_page_ready
         settings.image_tile_dir.mkdir(parents=True, exist_ok=True)
         settings.image_background_dir.mkdir(parents=True, exist_ok=True)
         settings.image_cast_dir.mkdir(parents=True, exist_ok=True)
@@ -82,29 +89,133 @@ class ScraperService:
             pass
         return None
 
-    async def _create_page(self) -> tuple[Playwright, Browser, BrowserContext, Page]:
-        p = await async_playwright().start()
-        browser = await p.chromium.launch(headless=settings.browser_headless)
-        user_agent = (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        context = await browser.new_context(
-            user_agent=user_agent,
-            viewport={"width": 1920, "height": 1080},
-            locale="en-US",
-        )
-        page = await context.new_page()
-        return p, browser, context, page
-
-    async def _cleanup(self, p: Playwright, browser: Browser, context: BrowserContext) -> None:
-        await context.close()
-        await browser.close()
-        await p.stop()
+    async def _block_resources(self, context: BrowserContext, origin: SiteOrigin) -> None:
+        if not settings.browser_block_resources:
+            return
 
-    async def scrape_page(self, url: str, wait_selector: str | None = None) -> str:
-        p, browser, context, page = await self._create_page()
+        resource_types = origin.get_blocked_resource_types()
+        patterns = origin.get_blocked_url_patterns()
+        blocked_urls = re.compile("|".join(patterns)) if patterns else None
+
+        async def handle(route: Route) -> None:
+            request = route.request
+            if request.resource_type in resource_types or (
+                blocked_urls is not None and blocked_urls.search(request.url)
+            ):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        # Registered on the context, so detail pages opened from it are covered too.
+        await context.route("**/*", handle)
+
+    async def _wait_until_ready(
+        self,
+        page: Page,
+        readiness: list[Readiness],
+        origin: SiteOrigin,
+        page_kind: str,
+        report: Callable[[str, int], None] | None = None,
+    ) -> None:
+        waited = await wait_until_ready(page, readiness)
+        if self.on_page_ready:
+            self.on_page_ready(origin.name, page_kind, waited)
+        if report:
+            report("wait_ms", int(waited * 1000))
+        logger.debug("%s page ready after %.2fs: %s", page_kind, waited, page.url)
+
+    @contextlib.asynccontextmanager
+    async def _detail_client(self, max_concurrent: int) -> AsyncIterator[httpx.AsyncClient | None]:
+        if not settings.scrape_http_detail:
+            yield None
+            return
+
+        async with httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"},
+            follow_redirects=True,
+            timeout=settings.scrape_http_timeout,
+            limits=httpx.Limits(max_connections=max_concurrent),
+        ) as client:
+            yield client
+
+    async def _fetch_detail_http(
+        self, client: httpx.AsyncClient, origin: SiteOrigin, show: ScrapeShow
+    ) -> ScrapeShow | None:
+        try:
+            response = await client.get(show.detail_url)
+        except httpx.HTTPError as e:
+            logger.debug("HTTP detail fetch failed for %s: %s", show.detail_url, e)
+            return None
+        if response.status_code != 200:
+            logger.debug("HTTP detail fetch got %d for %s", response.status_code, show.detail_url)
+            return None
+        return origin.extract_detail_html(response.text, show)
+
+    async def _fetch_detail(
+        self,
+        context: BrowserContext,
+        client: httpx.AsyncClient | None,
+        origin: SiteOrigin,
+        show: ScrapeShow,
+        readiness: list[Readiness],
+        report: Callable[[str, int], None],
+    ) -> ScrapeShow | None:
+        # The server-rendered HTML usually carries the JSON-LD already; a
+        # browser tab is only opened when it does not.
+        if client is not None:
+            detailed = await self._fetch_detail_http(client, origin, show)
+            if detailed is not None:
+                report("http_detail", 1)
+                return detailed
+
+        detail_page = await context.new_page()
         try:
+            await detail_page.goto(show.detail_url, wait_until="domcontentloaded")
+            await self._wait_until_ready(detail_page, readiness, origin, "detail", report)
+            return await origin.extract_detail_page(detail_page, show)
+        finally:
+            await detail_page.close()
+
+    async def _scroll_listing(
+        self, page: Page, origin: SiteOrigin, max_items: int | None
+    ) -> AsyncIterator[ScrapeShow]:
+        # Yields each title once, numbered in the order it first appeared,
+        # scrolling until max_items is reached or the list stops growing.
+        scroll = origin.get_listing_scroll()
+        seen: set[str] = set()
+        scrolls = 0
+        idle = 0
+        while True:
+            result = await origin.extract_from_page(page)
+            if not isinstance(result, ScrapeShowList):
+                # Origins without a DOM extractor hand the rendered page to the LLM once.
+                content = await page.content()
+                result = await self.llm.extract_structured(
+                    content, origin.get_extraction_schema(), origin.get_extraction_prompt()
+                )
+                if not isinstance(result, ScrapeShowList):
+                    return
+                scroll = None
+
+            for show in result.items:
+                if not show.detail_url or not show.slug or show.slug in seen:
+                    continue
+                seen.add(show.slug)
+                yield show.model_copy(update={"position": len(seen)})
+                if max_items is not None and len(seen) >= max_items:
+                    logger.info("Reached %d items after %d scroll(s)", len(seen), scrolls)
+                    return
+
+            if scroll is None or scrolls >= scroll.max_scrolls or idle >= scroll.idle_scrolls:
+                logger.info("Listing ended at %d items after %d scroll(s)", len(seen), scrolls)
+                return
+
+            scrolls += 1
+            idle = 0 if await scroll.scroll(page) else idle + 1
+
+    async def scrape_page(self, url: str, wait_selector: str | None = None) -> str:
+        async with browser_pool.context() as context:
+            page = await context.new_page()
             await page.goto(url, wait_until="domcontentloaded")
 
             if wait_selector:
@@ -112,18 +223,14 @@ class ScraperService:
                     await page.wait_for_selector(wait_selector, timeout=10000)
 
             return await page.content()
-        finally:
-            await self._cleanup(p, browser, context)
 
     async def extract_with_origin(self, url: str, origin: SiteOrigin) -> BaseModel:
-        p, browser, context, page = await self._create_page()
-        try:
+        async with browser_pool.context() as context:
+            await self._block_resources(context, origin)
+            page = await context.new_page()
             await page.goto(url, wait_until="domcontentloaded")
 
-            wait_selector = origin.get_wait_selector()
-            if wait_selector:
-                with contextlib.suppress(Exception):
-                    await page.wait_for_selector(wait_selector, timeout=10000)
+            await self._wait_until_ready(page, origin.get_listing_readiness(), origin, "listing")
 
             result = await origin.extract_from_page(page)
             if result is not None:
@@ -133,8 +240,6 @@ class ScraperService:
             return await self.llm.extract_structured(
                 content, origin.get_extraction_schema(), origin.get_extraction_prompt()
             )
-        finally:
-            await self._cleanup(p, browser, context)
 
     async def extract_data(
         self,
@@ -161,121 +266,87 @@ class ScraperService:
         download_cast_images: bool = False,
         download_background_images: bool = False,
         on_item_ready: Callable[[ScrapeShow], Awaitable[None]] | None = None,
+        on_progress: Callable[[str, int], None] | None = None,
     ) -> ScrapeShowList:
-        p, browser, context, page = await self._create_page()
-        try:
+        def report(key: str, amount: int = 1) -> None:
+            if on_progress:
+                on_progress(key, amount)
+
+        async with (
+            browser_pool.context() as context,
+            self._detail_client(max_concurrent) as client,
+        ):
+            await self._block_resources(context, origin)
+            page = await context.new_page()
             await page.goto(url, wait_until="domcontentloaded")
 
-            wait_selector = origin.get_wait_selector()
-            if wait_selector:
-                with contextlib.suppress(Exception):
-                    await page.wait_for_selector(wait_selector, timeout=10000)
-
-            await asyncio.sleep(8)
-            await page.evaluate("window.scrollBy(0, 2000)")
-            await asyncio.sleep(5)
+            readiness = origin.get_listing_readiness()
+            await self._wait_until_ready(page, readiness, origin, "listing", report)
             logger.debug("Main page loaded, extracting shows from listing")
 
-            result = await origin.extract_from_page(page)
-
-            if result is None or not isinstance(result, ScrapeShowList):
-                content = await page.content()
-                result = await self.llm.extract_structured(
-                    content, origin.get_extraction_schema(), origin.get_extraction_prompt()
-                )
-                if not isinstance(result, ScrapeShowList):
-                    return ScrapeShowList(items=[])
-
-            shows_list: list[ScrapeShow] = list(result.items)
-
-            if download_tile_images:
-                images_saved = 0
-
-                async def download_show_image(show: ScrapeShow) -> ScrapeShow:
-                    nonlocal images_saved
-                    if show.image_url and show.slug and show.source:
-                        local_path = await self._download_image(
-                            show.image_url, show.slug, show.source
-                        )
-                        if local_path:
-                            images_saved += 1
-                            return show.model_copy(update={"local_image_path": local_path})
-                    return show
-
-                image_tasks = [download_show_image(s) for s in result.items]
-                shows_with_images = await asyncio.gather(*image_tasks, return_exceptions=True)
-                shows_list = [s for s in shows_with_images if isinstance(s, ScrapeShow)]
-                logger.info("Tile images saved: %d", images_saved)
-
-            seen_slugs: set[str] = set()
-            unique_shows: list[ScrapeShow] = []
-
-            for show in shows_list:
-                if show.detail_url and show.slug and show.slug not in seen_slugs:
-                    seen_slugs.add(show.slug)
-                    unique_shows.append(show)
-
-            if max_items is not None:
-                unique_shows = unique_shows[:max_items]
-
-            logger.info("Total items to fetch details: %d", len(unique_shows))
-            for show in unique_shows:
-                logger.info("Queued: %s", show.title)
-
             semaphore = asyncio.Semaphore(max_concurrent)
-            detail_wait_selector = origin.get_detail_wait_selector()
+            detail_readiness = origin.get_detail_readiness()
             successful_count = 0
             failed_count = 0
+            images_saved = 0
+
+            async def download_show_image(show: ScrapeShow) -> ScrapeShow:
+                nonlocal images_saved
+                if show.image_url and show.slug and show.source:
+                    local_path = await self._download_image(show.image_url, show.slug, show.source)
+                    if local_path:
+                        images_saved += 1
+                        report("images_saved")
+                        return show.model_copy(update={"local_image_path": local_path})
+                return show
 
             async def fetch_detail(show: ScrapeShow) -> ScrapeShow:
                 nonlocal successful_count, failed_count
+                if download_tile_images:
+                    show = await download_show_image(show)
                 if not show.detail_url:
                     return show
                 async with semaphore:
                     logger.info("Fetching: %s -> %s", show.title, show.detail_url)
-                    detail_page = await context.new_page()
                     try:
-                        await detail_page.goto(show.detail_url, wait_until="domcontentloaded")
-                        if detail_wait_selector:
-                            with contextlib.suppress(Exception):
-                                await detail_page.wait_for_selector(
-                                    detail_wait_selector, timeout=10000
-                                )
-                        json_ld_check_js = """() => {
-                            const scripts = document.querySelectorAll(
-                                'script[type="application/ld+json"]'
-                            );
-                            for (const s of scripts) {
-                                try {
-                                    const data = JSON.parse(s.textContent);
-                                    if (data['@type'] === 'Movie') return true;
-                                    if (data['@type'] === 'TVSeries') return true;
-                                } catch {}
-                            }
-                            return false;
-                        }"""
-                        with contextlib.suppress(Exception):
-                            await detail_page.wait_for_function(json_ld_check_js, timeout=15000)
-                        await asyncio.sleep(3)
-                        detailed = await origin.extract_detail_page(detail_page, show)
+                        detailed = await self._fetch_detail(
+                            context, client, origin, show, detail_readiness, report
+                        )
                         if detailed and detailed.overview:
                             successful_count += 1
+                            report("fetched")
                             logger.info("Extracted: %s", show.title)
                             final_show = detailed.model_copy(update={"position": show.position})
                             if on_item_ready:
                                 await on_item_ready(final_show)
                             return final_show
                         failed_count += 1
+                        report("failed")
                         return show
                     except Exception as e:
                         failed_count += 1
+                        report("failed")
                         logger.warning("Failed to fetch detail for %s: %s", show.slug, e)
                         return show
-                    finally:
-                        await detail_page.close()
 
-            tasks = [fetch_detail(show) for show in unique_shows]
+            # Detail fetches start as soon as each title appears, while the
+            # listing keeps scrolling.
+            tasks: list[asyncio.Task[ScrapeShow]] = []
+            try:
+                async for show in self._scroll_listing(page, origin, max_items):
+                    logger.info("Queued: %s", show.title)
+                    report("discovered")
+                    tasks.append(asyncio.create_task(fetch_detail(show)))
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            logger.info("Total items to fetch details: %d", len(tasks))
             detailed_shows = await asyncio.gather(*tasks, return_exceptions=True)
+            if download_tile_images:
+                logger.info("Tile images saved: %d", images_saved)
 
             valid_shows = [s for s in detailed_shows if isinstance(s, ScrapeShow)]
 
@@ -296,6 +367,8 @@ class ScraperService:
                             local_path = await self._download_cast_image(
                                 member.image_url, member.name
                             )
+                            if local_path:
+                                report("images_saved")
                             updated_cast.append(
                                 ScrapeCastMember(
                                     name=member.name,
@@ -312,31 +385,34 @@ class ScraperService:
                 final_shows = [s for s in shows_with_cast_images if isinstance(s, ScrapeShow)]
 
             return ScrapeShowList(items=final_shows)
-        finally:
-            await self._cleanup(p, browser, context)
 
     async def extract_top_ten(
         self,
         origin: SiteOrigin,
         max_concurrent: int = 5,
         on_item_ready: Callable[[ScrapeShow, str], Awaitable[None]] | None = None,
+        on_progress: Callable[[str, int], None] | None = None,
     ) -> TopTenResult | None:
+        def report(key: str, amount: int = 1) -> None:
+            if on_progress:
+                on_progress(key, amount)
+
         url = origin.get_top_ten_url()
         if not url:
             return None
 
-        p, browser, context, page = await self._create_page()
-        try:
+        async with (
+            browser_pool.context() as context,
+            self._detail_client(max_concurrent) as client,
+        ):
+            await self._block_resources(context, origin)
+            page = await context.new_page()
             await page.goto(url, wait_until="domcontentloaded")
 
-            wait_selector = origin.get_top_ten_wait_selector()
-            if wait_selector:
-                with contextlib.suppress(Exception):
-                    await page.wait_for_selector(wait_selector, timeout=10000)
-
-            await asyncio.sleep(5)
+            readiness = origin.get_top_ten_readiness()
+            await self._wait_until_ready(page, readiness, origin, "top_ten", report)
             await page.evaluate("window.scrollBy(0, 2000)")
-            await asyncio.sleep(3)
+            await self._wait_until_ready(page, readiness, origin, "top_ten_scroll", report)
             logger.debug("Top ten page loaded, extracting shows")
 
             result = await origin.extract_top_ten(page)
@@ -345,52 +421,33 @@ class ScraperService:
 
             logger.info("Top 10 Movies: %s", [s.title for s in result.movies.items])
             logger.info("Top 10 Series: %s", [s.title for s in result.series.items])
+            report("discovered", len(result.movies.items) + len(result.series.items))
 
             semaphore = asyncio.Semaphore(max_concurrent)
-            detail_wait_selector = origin.get_detail_wait_selector()
+            detail_readiness = origin.get_detail_readiness()
 
             async def fetch_detail(show: ScrapeShow, show_type: str) -> ScrapeShow:
                 if not show.detail_url:
                     return show
                 async with semaphore:
                     logger.info("Fetching: %s -> %s", show.title, show.detail_url)
-                    detail_page = await context.new_page()
                     try:
-                        await detail_page.goto(show.detail_url, wait_until="domcontentloaded")
-                        if detail_wait_selector:
-                            with contextlib.suppress(Exception):
-                                await detail_page.wait_for_selector(
-                                    detail_wait_selector, timeout=10000
-                                )
-                        json_ld_check_js = """() => {
-                            const scripts = document.querySelectorAll(
-                                'script[type="application/ld+json"]'
-                            );
-                            for (const s of scripts) {
-                                try {
-                                    const data = JSON.parse(s.textContent);
-                                    if (data['@type'] === 'Movie') return true;
-                                    if (data['@type'] === 'TVSeries') return true;
-                                } catch {}
-                            }
-                            return false;
-                        }"""
-                        with contextlib.suppress(Exception):
-                            await detail_page.wait_for_function(json_ld_check_js, timeout=15000)
-                        await asyncio.sleep(3)
-                        detailed = await origin.extract_detail_page(detail_page, show)
+                        detailed = await self._fetch_detail(
+                            context, client, origin, show, detail_readiness, report
+                        )
                         if detailed and detailed.overview:
+                            report("fetched")
                             logger.info("Extracted: %s", show.title)
                             final_show = detailed.model_copy(update={"position": show.position})
                             if on_item_ready:
                                 await on_item_ready(final_show, show_type)
                             return final_show
+                        report("failed")
                         return show
                     except Exception as e:
+                        report("failed")
                         logger.warning("Failed to fetch detail for %s: %s", show.slug, e)
                         return show
-                    finally:
-                        await detail_page.close()
 
             movie_tasks = [fetch_detail(show, "movie") for show in result.movies.items]
             series_tasks = [fetch_detail(show, "series") for show in result.series.items]
@@ -405,5 +462,3 @@ class ScraperService:
                 movies=ScrapeShowList(items=valid_movies),
                 series=ScrapeShowList(items=valid_series),
             )
-        finally:
-            await self._cleanup(p, browser, context)
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
 
 from app.schemas.scrape import ScrapeShow, ScrapeShowList
 
+from .readiness import JsonLdReady, NetworkIdle, Readiness, SelectorPresent
+from .scroll import InfiniteScroll
+
 
 class TopTenResult:
     def __init__(self, movies: ScrapeShowList, series: ScrapeShowList):
@@ -15,6 +18,20 @@ class TopTenResult:
         self.series = series
 
 
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+BLOCKED_URL_PATTERNS = [
+    r"googletagmanager\.com",
+    r"google-analytics\.com",
+    r"doubleclick\.net",
+    r"googlesyndication\.com",
+    r"amazon-adsystem\.com",
+    r"connect\.facebook\.net",
+    r"scorecardresearch\.com",
+    r"hotjar\.com",
+]
+
+
 class SiteOrigin(ABC):
     @property
     @abstractmethod
@@ -39,17 +56,47 @@ class SiteOrigin(ABC):
     def get_detail_wait_selector(self) -> str | None:
         return None
 
+    def get_listing_readiness(self) -> list[Readiness]:
+        selector = self.get_wait_selector()
+        if selector:
+            return [SelectorPresent(selector), NetworkIdle()]
+        return [NetworkIdle()]
+
+    def get_detail_readiness(self) -> list[Readiness]:
+        selector = self.get_detail_wait_selector()
+        if selector:
+            return [SelectorPresent(selector), JsonLdReady()]
+        return [JsonLdReady()]
+
+    def get_listing_scroll(self) -> InfiniteScroll | None:
+        return InfiniteScroll(self.get_wait_selector())
+
+    def get_blocked_resource_types(self) -> frozenset[str]:
+        return BLOCKED_RESOURCE_TYPES
+
+    def get_blocked_url_patterns(self) -> list[str]:
+        return BLOCKED_URL_PATTERNS
+
     async def extract_from_page(self, page: "Page") -> BaseModel | None:
         return None
 
     async def extract_detail_page(self, page: "Page", base_show: ScrapeShow) -> ScrapeShow | None:
         return None
 
+    def extract_detail_html(self, html: str, base_show: ScrapeShow) -> ScrapeShow | None:
+        return None
+
     def get_top_ten_url(self) -> str | None:
         return None
 
     def get_top_ten_wait_selector(self) -> str | None:
         return None
 
+    def get_top_ten_readiness(self) -> list[Readiness]:
+        selector = self.get_top_ten_wait_selector()
+        if selector:
+            return [SelectorPresent(selector), NetworkIdle()]
+        return [NetworkIdle()]
+
     async def extract_top_ten(self, page: "Page") -> TopTenResult | None:
         return None
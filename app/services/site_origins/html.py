@@ -0,0 +1,99 @@
+import json
+from html.parser import HTMLParser
+from typing import Any
+
+VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+)
+
+
+class JsonLdParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.blocks: list[str] = []
+        self._current: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "script" and dict(attrs).get("type") == "application/ld+json":
+            self._current = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script" and self._current is not None:
+            self.blocks.append("".join(self._current))
+            self._current = None
+
+    def handle_data(self, data: str) -> None:
+        if self._current is not None:
+            self._current.append(data)
+
+
+class CreditParser(HTMLParser):
+    # Collects name -> image URL for every element carrying item_class, reading
+    # the name from its name_class descendant and the image from its first img.
+    def __init__(self, item_class: str, name_class: str):
+        super().__init__()
+        self.item_class = item_class
+        self.name_class = name_class
+        self.credits: list[tuple[str, str | None]] = []
+        self._item_depth = 0
+        self._name_depth = 0
+        self._name: list[str] = []
+        self._image: str | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+        void = tag in VOID_ELEMENTS
+
+        if self._item_depth == 0:
+            if self.item_class in classes and not void:
+                self._item_depth = 1
+                self._name = []
+                self._image = None
+            return
+
+        if tag == "img" and self._image is None:
+            self._image = attributes.get("src") or attributes.get("data-src")
+        if void:
+            return
+
+        self._item_depth += 1
+        if self._name_depth:
+            self._name_depth += 1
+        elif self.name_class in classes:
+            self._name_depth = 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._item_depth == 0 or tag in VOID_ELEMENTS:
+            return
+
+        if self._name_depth:
+            self._name_depth -= 1
+        self._item_depth -= 1
+        if self._item_depth == 0:
+            name = "".join(self._name).strip()
+            if name:
+                self.credits.append((name, self._image))
+
+    def handle_data(self, data: str) -> None:
+        if self._name_depth:
+            self._name.append(data)
+
+
+def find_json_ld(html: str, types: tuple[str, ...]) -> dict[str, Any] | None:
+    parser = JsonLdParser()
+    parser.feed(html)
+    for block in parser.blocks:
+        try:
+            parsed = json.loads(block)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict) and parsed.get("@type") in types:
+            return parsed
+    return None
+
+
+def find_credits(html: str, item_class: str, name_class: str) -> list[tuple[str, str | None]]:
+    parser = CreditParser(item_class, name_class)
+    parser.feed(html)
+    return parser.credits
@@ -1,4 +1,3 @@
-import json
 import logging
 import re
 from typing import TYPE_CHECKING, Any
@@ -15,13 +14,72 @@ from app.schemas.scrape import (
     ScrapeStreamingOption,
 )
 
-from .base import SiteOrigin, TopTenResult
+from .base import BLOCKED_URL_PATTERNS, SiteOrigin, TopTenResult
+from .html import find_credits, find_json_ld
+from .readiness import ItemCountStable, JsonLdReady, Readiness, SelectorPresent
+from .scroll import InfiniteScroll
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
 
 logger = logging.getLogger(__name__)
 
+TITLE_LINKS = "a[href*='/us/movie/'], a[href*='/us/tv-show/']"
+TOP_TEN_LINKS = ".global-titles a[href*='/movie/'], .global-titles a[href*='/tv-show/']"
+DETAIL_JSON_LD_TYPES = ("Movie", "TVSeries")
+CAST_PORTRAIT_MARKER = "images.justwatch.com/portrait"
+
+# Listing and top ten extraction read every link in one evaluate call rather
+# than one Playwright round trip per attribute.
+LISTING_LINKS_JS = """(selector) => {
+    const grid = document.querySelector('.title-list-grid');
+    const links = Array.from((grid || document).querySelectorAll(selector), (link) => {
+        const img = link.querySelector('img');
+        return {href: link.getAttribute('href'), image: img ? img.getAttribute('src') : null};
+    });
+    return {grid: grid !== null, links};
+}"""
+
+TOP_TEN_SECTIONS_JS = """() => {
+    const sections = document.querySelectorAll('.global-titles');
+    return Array.from(sections, (section) => {
+        const header = section.querySelector('.global-titles__card h2, .global-titles__card h3');
+        const links = section.querySelectorAll("a[href*='/movie/'], a[href*='/tv-show/']");
+        return {
+            header: header ? header.innerText : null,
+            links: Array.from(links, (link) => {
+                const img = link.querySelector('img');
+                const image = img ? img.getAttribute('src') : null;
+                return {href: link.getAttribute('href'), image};
+            }),
+        };
+    });
+}"""
+
+# The Movie/TVSeries JSON-LD and the cast name -> portrait map in one call.
+DETAIL_PAGE_JS = """({types, marker}) => {
+    let data = null;
+    for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+        try {
+            const parsed = JSON.parse(script.textContent);
+            if (parsed && types.includes(parsed['@type'])) {
+                data = parsed;
+                break;
+            }
+        } catch {}
+    }
+
+    const cast = {};
+    for (const actor of document.querySelectorAll('.title-credits__actor')) {
+        const img = actor.querySelector('img');
+        const nameEl = actor.querySelector('.title-credit-name');
+        const name = nameEl ? nameEl.innerText.trim() : '';
+        const src = img ? img.getAttribute('src') : null;
+        if (name && src && src.includes(marker)) cast[name] = src;
+    }
+    return {data, cast};
+}"""
+
 
 class SiteOriginJustWatch(SiteOrigin):
     BASE_URL = "https://www.justwatch.com/us"
@@ -82,80 +140,92 @@ Return all shows found on the page."""
         return ScrapeShowList
 
     def get_wait_selector(self) -> str | None:
-        return "a[href*='/us/movie/'], a[href*='/us/tv-show/']"
+        return TITLE_LINKS
 
     def get_detail_wait_selector(self) -> str | None:
         return "script[type='application/ld+json']"
 
-    async def extract_from_page(self, page: "Page") -> ScrapeShowList:
-        shows: list[ScrapeShow] = []
+    # The grid and the top ten rows are rendered client-side in batches, so
+    # the pages are ready once the number of title links stops growing.
+    def get_listing_readiness(self) -> list[Readiness]:
+        return [SelectorPresent(TITLE_LINKS), ItemCountStable(TITLE_LINKS)]
+
+    def get_detail_readiness(self) -> list[Readiness]:
+        return [JsonLdReady(), ItemCountStable(".title-credits__actor", min_count=0)]
+
+    # The grid appends roughly a viewport of titles per scroll and can take a
+    # moment to fetch the next page from the API.
+    def get_listing_scroll(self) -> InfiniteScroll | None:
+        return InfiniteScroll(TITLE_LINKS, step=2500, max_scrolls=40, growth_timeout=4.0)
+
+    def get_blocked_url_patterns(self) -> list[str]:
+        # Poster and portrait URLs are read from img attributes, so the image
+        # CDN itself never needs to be fetched.
+        return [
+            *BLOCKED_URL_PATTERNS,
+            r"images\.justwatch\.com",
+            r"sentry\.io",
+            r"bat\.bing\.com",
+            r"adsafeprotected\.com",
+            r"moatads\.com",
+        ]
 
-        grid_container = await page.query_selector(".title-list-grid")
-        if grid_container:
-            links = await grid_container.query_selector_all(
-                "a[href*='/us/movie/'], a[href*='/us/tv-show/']"
-            )
-            logger.debug("Found %d links in .title-list-grid container", len(links))
+    async def extract_from_page(self, page: "Page") -> ScrapeShowList:
+        payload = await page.evaluate(LISTING_LINKS_JS, TITLE_LINKS)
+        if payload["grid"]:
+            logger.debug("Found %d links in .title-list-grid container", len(payload["links"]))
         else:
-            links = await page.query_selector_all("a[href*='/us/movie/'], a[href*='/us/tv-show/']")
             logger.debug(
-                "No .title-list-grid found, using page-wide selector: %d links", len(links)
+                "No .title-list-grid found, using page-wide selector: %d links",
+                len(payload["links"]),
             )
 
-        position = 1
-        for link in links:
-            href = await link.get_attribute("href")
-            if not href:
-                continue
-
-            is_movie = "/us/movie/" in href
-            show_type = ShowType.MOVIE if is_movie else ShowType.SERIES
-
-            slug = href.rstrip("/").split("/")[-1]
-            title = self._slug_to_title(slug)
-
-            detail_url = f"https://www.justwatch.com{href}" if href.startswith("/") else href
-
-            img = await link.query_selector("img")
-            image_url = await img.get_attribute("src") if img else None
-
-            shows.append(
-                ScrapeShow(
-                    show_type=show_type,
-                    source=self.SOURCE_NAME,
-                    slug=slug,
-                    detail_url=detail_url,
-                    title=title,
-                    image_url=image_url,
-                    position=position,
-                )
-            )
-            position += 1
+        shows: list[ScrapeShow] = []
+        for link in payload["links"]:
+            if link["href"]:
+                shows.append(self._link_to_show(link, position=len(shows) + 1))
 
         return ScrapeShowList(items=shows)
 
+    def _link_to_show(self, link: dict[str, str | None], position: int) -> ScrapeShow:
+        href = link["href"] or ""
+        slug = href.rstrip("/").split("/")[-1]
+        return ScrapeShow(
+            show_type=ShowType.MOVIE if "/movie/" in href else ShowType.SERIES,
+            source=self.SOURCE_NAME,
+            slug=slug,
+            detail_url=f"https://www.justwatch.com{href}" if href.startswith("/") else href,
+            title=self._slug_to_title(slug),
+            image_url=link["image"],
+            position=position,
+        )
+
     async def extract_detail_page(self, page: "Page", base_show: ScrapeShow) -> ScrapeShow | None:
-        json_ld_scripts = await page.query_selector_all("script[type='application/ld+json']")
-        if not json_ld_scripts:
-            logger.warning("No JSON-LD scripts found for %s", base_show.slug)
+        payload = await page.evaluate(
+            DETAIL_PAGE_JS, {"types": list(DETAIL_JSON_LD_TYPES), "marker": CAST_PORTRAIT_MARKER}
+        )
+        if payload["data"] is None:
+            logger.warning("No Movie/TVSeries JSON-LD found for %s", base_show.slug)
             return None
 
-        data: dict[str, Any] | None = None
-        for script in json_ld_scripts:
-            try:
-                json_text = await script.inner_text()
-                parsed = json.loads(json_text)
-                if parsed.get("@type") in ("Movie", "TVSeries"):
-                    data = parsed
-                    break
-            except (json.JSONDecodeError, Exception) as e:
-                logger.debug("Failed to parse JSON-LD script: %s", e)
-                continue
+        return self._build_detail_show(payload["data"], payload["cast"], base_show)
 
+    def extract_detail_html(self, html: str, base_show: ScrapeShow) -> ScrapeShow | None:
+        data = find_json_ld(html, DETAIL_JSON_LD_TYPES)
         if data is None:
-            logger.warning("No Movie/TVSeries JSON-LD found for %s", base_show.slug)
             return None
 
+        credits = find_credits(html, "title-credits__actor", "title-credit-name")
+        cast_images = {
+            name: image_url
+            for name, image_url in credits
+            if image_url and CAST_PORTRAIT_MARKER in image_url
+        }
+        return self._build_detail_show(data, cast_images, base_show)
+
+    def _build_detail_show(
+        self, data: dict[str, Any], cast_images: dict[str, str], base_show: ScrapeShow
+    ) -> ScrapeShow:
         logger.debug("Found JSON-LD data for %s: type=%s", base_show.slug, data.get("@type"))
 
         show_type = self._parse_show_type(data.get("@type"))
@@ -165,7 +235,7 @@ Return all shows found on the page."""
         genres = self._parse_genres(data.get("genre", []))
         directors = self._parse_directors(data.get("director", []))
         creators = self._parse_directors(data.get("author", []))
-        cast = await self._extract_cast_with_images(page, data.get("actor", []))
+        cast = self._build_cast(data.get("actor", []), cast_images)
         streaming_options = self._parse_streaming_options(data.get("potentialAction", []))
 
         aggregate_rating = data.get("aggregateRating", {})
@@ -239,8 +309,8 @@ Return all shows found on the page."""
                 result.append(name)
         return result
 
-    async def _extract_cast_with_images(
-        self, page: "Page", actors: list[dict[str, Any]]
+    def _build_cast(
+        self, actors: list[dict[str, Any]], cast_images: dict[str, str]
     ) -> list[ScrapeCastMember]:
         actor_names: list[str] = []
         for entry in actors:
@@ -252,24 +322,9 @@ Return all shows found on the page."""
             if name:
                 actor_names.append(name)
 
-        cast_elements = await page.query_selector_all(".title-credits__actor")
-
-        cast_with_images: dict[str, str] = {}
-        for element in cast_elements:
-            img = await element.query_selector("img")
-            name_el = await element.query_selector(".title-credit-name")
-            if img and name_el:
-                name = await name_el.inner_text()
-                image_url = await img.get_attribute("src")
-                if name and image_url and "images.justwatch.com/portrait" in image_url:
-                    cast_with_images[name.strip()] = image_url
-
-        result: list[ScrapeCastMember] = []
-        for name in actor_names:
-            image_url = cast_with_images.get(name)
-            result.append(ScrapeCastMember(name=name, image_url=image_url))
-
-        return result
+        return [
+            ScrapeCastMember(name=name, image_url=cast_images.get(name)) for name in actor_names
+        ]
 
     def _parse_streaming_options(
         self, actions: list[dict[str, Any]]
@@ -336,22 +391,18 @@ Return all shows found on the page."""
     def get_top_ten_wait_selector(self) -> str | None:
         return ".global-titles"
 
+    def get_top_ten_readiness(self) -> list[Readiness]:
+        return [SelectorPresent(".global-titles"), ItemCountStable(TOP_TEN_LINKS)]
+
     async def extract_top_ten(self, page: "Page") -> TopTenResult | None:
         movies: list[ScrapeShow] = []
         series: list[ScrapeShow] = []
 
-        sections = await page.query_selector_all(".global-titles")
+        sections = await page.evaluate(TOP_TEN_SECTIONS_JS)
         logger.debug("Found %d global-titles sections", len(sections))
 
         for section in sections:
-            header = await section.query_selector(
-                ".global-titles__card h2, .global-titles__card h3"
-            )
-            if not header:
-                continue
-
-            header_text = (await header.inner_text()).lower()
-
+            header_text = (section["header"] or "").lower()
             if "top 10" not in header_text:
                 continue
 
@@ -361,50 +412,24 @@ Return all shows found on the page."""
             if not is_movies_section and not is_series_section:
                 continue
 
-            items = await section.query_selector_all("a[href*='/movie/'], a[href*='/tv-show/']")
+            links = section["links"]
             logger.debug(
                 "Section header='%s', is_movies=%s, is_series=%s, items=%d",
                 header_text,
                 is_movies_section,
                 is_series_section,
-                len(items),
+                len(links),
             )
 
+            target = movies if is_movies_section else series
             position = 1
-            for item in items:
-                if position > 10:
+            for link in links:
+                if position > 10 or len(target) >= 10:
                     break
-
-                href = await item.get_attribute("href")
-                if not href:
+                if not link["href"]:
                     continue
-
-                is_movie_link = "/movie/" in href
-                show_type = ShowType.MOVIE if is_movie_link else ShowType.SERIES
-
-                slug = href.rstrip("/").split("/")[-1]
-                title = self._slug_to_title(slug)
-                detail_url = f"https://www.justwatch.com{href}" if href.startswith("/") else href
-
-                img = await item.query_selector("img")
-                image_url = await img.get_attribute("src") if img else None
-
-                show = ScrapeShow(
-                    show_type=show_type,
-                    source=self.SOURCE_NAME,
-                    slug=slug,
-                    detail_url=detail_url,
-                    title=title,
-                    image_url=image_url,
-                    position=position,
-                )
-
-                if is_movies_section and len(movies) < 10:
-                    movies.append(show)
-                    position += 1
-                elif is_series_section and len(series) < 10:
-                    series.append(show)
-                    position += 1
+                target.append(self._link_to_show(link, position))
+                position += 1
 
         return TopTenResult(
             movies=ScrapeShowList(items=movies),
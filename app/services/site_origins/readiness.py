@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+JSON_LD_READY_JS = """() => {
+    const scripts = document.querySelectorAll('script[type="application/ld+json"]');
+    for (const s of scripts) {
+        try {
+            const data = JSON.parse(s.textContent);
+            if (data['@type'] === 'Movie' || data['@type'] === 'TVSeries') return true;
+        } catch {}
+    }
+    return false;
+}"""
+
+
+class Readiness(ABC):
+    @abstractmethod
+    async def wait(self, page: "Page", timeout: float) -> None:
+        pass
+
+
+class SelectorPresent(Readiness):
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    async def wait(self, page: "Page", timeout: float) -> None:
+        await page.wait_for_selector(self.selector, state="attached", timeout=timeout * 1000)
+
+
+class NetworkIdle(Readiness):
+    async def wait(self, page: "Page", timeout: float) -> None:
+        await page.wait_for_load_state("networkidle", timeout=timeout * 1000)
+
+
+class FunctionTrue(Readiness):
+    def __init__(self, expression: str):
+        self.expression = expression
+
+    async def wait(self, page: "Page", timeout: float) -> None:
+        await page.wait_for_function(self.expression, timeout=timeout * 1000)
+
+
+class JsonLdReady(FunctionTrue):
+    def __init__(self):
+        super().__init__(JSON_LD_READY_JS)
+
+
+class ItemCountStable(Readiness):
+    def __init__(
+        self,
+        selector: str,
+        min_count: int = 1,
+        interval: float = 0.5,
+        stable_checks: int = 2,
+    ):
+        self.selector = selector
+        self.min_count = min_count
+        self.interval = interval
+        self.stable_checks = stable_checks
+
+    async def wait(self, page: "Page", timeout: float) -> None:
+        # Ready once the number of matches has stopped changing for
+        # stable_checks polls in a row, i.e. the client-side render settled.
+        deadline = time.monotonic() + timeout
+        last_count = -1
+        stable = 0
+        while time.monotonic() < deadline:
+            count = await page.locator(self.selector).count()
+            if count == last_count and count >= self.min_count:
+                stable += 1
+                if stable >= self.stable_checks:
+                    return
+            else:
+                stable = 0
+            last_count = count
+            await asyncio.sleep(self.interval)
+        raise TimeoutError(f"'{self.selector}' did not settle within {timeout:.1f}s")
+
+
+async def wait_until_ready(
+    page: "Page", predicates: list[Readiness], timeout: float | None = None
+) -> float:
+    # Predicates run in order against one shared deadline. A predicate that
+    # times out is logged and skipped, so extraction still sees whatever has
+    # rendered by then.
+    timeout = timeout or settings.scrape_ready_timeout
+    started = time.monotonic()
+    deadline = started + timeout
+    for predicate in predicates:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.debug("Readiness deadline reached before %s", type(predicate).__name__)
+            break
+        try:
+            await predicate.wait(page, remaining)
+        except Exception as e:
+            logger.debug("Readiness check %s not met: %s", type(predicate).__name__, e)
+    return time.monotonic() - started
@@ -0,0 +1,47 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+LISTING_SIZE_JS = """(selector) => selector
+    ? document.querySelectorAll(selector).length
+    : document.documentElement.scrollHeight"""
+
+SCROLL_BY_JS = "(step) => window.scrollBy(0, step)"
+
+
+class InfiniteScroll:
+    def __init__(
+        self,
+        item_selector: str | None = None,
+        step: int = 2000,
+        max_scrolls: int = 20,
+        idle_scrolls: int = 2,
+        growth_timeout: float = 3.0,
+        interval: float = 0.25,
+    ):
+        self.item_selector = item_selector
+        self.step = step
+        self.max_scrolls = max_scrolls
+        self.idle_scrolls = idle_scrolls
+        self.growth_timeout = growth_timeout
+        self.interval = interval
+
+    async def size(self, page: "Page") -> int:
+        # Number of matching items, or the document height when the origin
+        # has no item selector.
+        return await page.evaluate(LISTING_SIZE_JS, self.item_selector)
+
+    async def scroll(self, page: "Page") -> bool:
+        # Scrolls one step and returns as soon as the list grows, or False once
+        # growth_timeout passes without anything new rendering.
+        before = await self.size(page)
+        await page.evaluate(SCROLL_BY_JS, self.step)
+        deadline = time.monotonic() + self.growth_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.interval)
+            if await self.size(page) > before:
+                return True
+        return False
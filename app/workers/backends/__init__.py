@@ -0,0 +1,9 @@
+from app.workers.backends.base import QueueBackend
+from app.workers.backends.memory import MemoryQueueBackend
+from app.workers.backends.postgres import PostgresQueueBackend
+
+__all__ = [
+    "MemoryQueueBackend",
+    "PostgresQueueBackend",
+    "QueueBackend",
+]
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+
+from app.enums import JobType
+from app.models import Job
+from app.schemas.job import JobTypeBacklog
+from app.workers.notifier import QueueNotifier
+
+
+class QueueBackend(ABC):
+    name: str
+
+    def create_notifier(self, channel: str | None = None) -> QueueNotifier:
+        return QueueNotifier(channel)
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        job_type: JobType,
+        payload: dict | None = None,
+        priority: int = 0,
+        delay_seconds: int = 0,
+        dedup_key: str | None = None,
+        depends_on: list[int] | None = None,
+    ) -> Job | None: ...
+
+    @abstractmethod
+    async def get_job(self, job_id: int) -> Job | None: ...
+
+    @abstractmethod
+    async def get_backlog(self) -> list[JobTypeBacklog]: ...
+
+    @abstractmethod
+    async def claim_jobs(
+        self, worker_id: str, n: int, job_types: list[JobType] | None = None
+    ) -> list[Job]: ...
+
+    @abstractmethod
+    async def release_jobs(self, job_ids: list[int]) -> None: ...
+
+    @abstractmethod
+    async def requeue_job(self, job: Job) -> bool: ...
+
+    @abstractmethod
+    async def renew_lease(self, job: Job) -> bool: ...
+
+    @abstractmethod
+    async def reap_expired_jobs(self) -> int: ...
+
+    @abstractmethod
+    async def complete_job(self, job: Job, result: dict | None = None) -> None: ...
+
+    @abstractmethod
+    async def fail_job(self, job: Job, error: str) -> None: ...
+
+    @abstractmethod
+    async def cancel_job(self, job_id: int) -> Job | None: ...
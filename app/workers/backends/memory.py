@@ -0,0 +1,305 @@
+import heapq
+import itertools
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.enums import JobStatus, JobType
+from app.models import Job
+from app.schemas.job import JobTypeBacklog
+from app.services.claim_policy import get_job_type_weight, rank_at
+from app.services.queue_service import ACTIVE_STATUSES, TERMINAL_FAILURES
+from app.services.retry_policy import get_retry_policy
+from app.workers.backends.base import QueueBackend
+from app.workers.notifier import QueueNotifier
+
+DEFAULT_MAX_ATTEMPTS: int = Job.__table__.c.max_attempts.default.arg
+
+
+class MemoryQueueBackend(QueueBackend):
+    name = "memory"
+
+    def __init__(self):
+        self._jobs: dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._children: dict[int, set[int]] = defaultdict(set)
+        self._dedup: dict[str, int] = {}
+        # Due jobs per type ordered by (rank_at, id), and jobs still waiting for
+        # scheduled_for ordered by (scheduled_for, id). Entries are dropped lazily
+        # when they no longer match the job they point at.
+        self._ready: dict[str, list[tuple[datetime, int]]] = defaultdict(list)
+        self._delayed: list[tuple[datetime, int]] = []
+        self._running: Counter[str] = Counter()
+        self._notifiers: dict[str, list[QueueNotifier]] = defaultdict(list)
+
+    # Nothing crosses a process boundary, so notifiers never LISTEN and are
+    # woken directly by the backend instead.
+    def create_notifier(self, channel: str | None = None) -> QueueNotifier:
+        notifier = QueueNotifier(channel, listen=False)
+        self._notifiers[notifier.channel].append(notifier)
+        return notifier
+
+    def _notify(self, channel: str, payload: str) -> None:
+        for notifier in self._notifiers[channel]:
+            notifier.wake(payload)
+
+    def _snapshot(self, job: Job) -> Job:
+        # Callers get a copy, like a row read from the database, so a stale
+        # worker cannot see attempts move underneath it when the job is re-claimed.
+        return Job(**{column.key: getattr(job, column.key) for column in Job.__table__.columns})
+
+    def _set_status(self, job: Job, status: JobStatus) -> None:
+        if job.status == JobStatus.PROCESSING:
+            self._running[job.job_type] -= 1
+        if status == JobStatus.PROCESSING:
+            self._running[job.job_type] += 1
+        job.status = status
+
+    def _make_pending(self, job: Job, scheduled_for: datetime) -> None:
+        self._set_status(job, JobStatus.PENDING)
+        job.scheduled_for = scheduled_for
+        job.rank_at = rank_at(scheduled_for, job.priority)
+        heapq.heappush(self._delayed, (scheduled_for, job.id))
+        self._notify(settings.queue_notify_channel, job.job_type)
+
+    def _promote_due(self, now: datetime) -> None:
+        while self._delayed and self._delayed[0][0] <= now:
+            scheduled_for, job_id = heapq.heappop(self._delayed)
+            job = self._jobs[job_id]
+            if job.status == JobStatus.PENDING and job.scheduled_for == scheduled_for:
+                heapq.heappush(self._ready[job.job_type], (job.rank_at, job.id))
+
+    def _pop_ready(self, job_type: str, n: int) -> list[Job]:
+        heap = self._ready[job_type]
+        popped: list[Job] = []
+        while heap and len(popped) < n:
+            ranked_at, job_id = heapq.heappop(heap)
+            job = self._jobs[job_id]
+            if job.status == JobStatus.PENDING and job.rank_at == ranked_at:
+                popped.append(job)
+        return popped
+
+    async def enqueue(
+        self,
+        job_type: JobType,
+        payload: dict | None = None,
+        priority: int = 0,
+        delay_seconds: int = 0,
+        dedup_key: str | None = None,
+        depends_on: list[int] | None = None,
+    ) -> Job | None:
+        parents = set(depends_on or [])
+        missing = parents - self._jobs.keys()
+        if missing:
+            raise ValueError(f"Unknown dependency job id(s): {sorted(missing)}")
+
+        if dedup_key is not None and dedup_key in self._dedup:
+            active = self._jobs[self._dedup[dedup_key]]
+            if active.status in ACTIVE_STATUSES:
+                return None
+
+        now = datetime.now()
+        scheduled_for = now + timedelta(seconds=max(delay_seconds, 0))
+        job = Job(
+            id=next(self._ids),
+            job_type=job_type.value,
+            payload=payload or {},
+            status=JobStatus.BLOCKED,
+            priority=priority,
+            attempts=0,
+            max_attempts=DEFAULT_MAX_ATTEMPTS,
+            created_at=now,
+            scheduled_for=scheduled_for,
+            rank_at=rank_at(scheduled_for, priority),
+            dedup_key=dedup_key,
+            pending_dependencies=0,
+        )
+
+        self._jobs[job.id] = job
+        if dedup_key is not None:
+            self._dedup[dedup_key] = job.id
+        for parent in parents:
+            self._children[parent].add(job.id)
+
+        broken = sorted(p for p in parents if self._jobs[p].status in TERMINAL_FAILURES)
+        remaining = sum(1 for p in parents if self._jobs[p].status != JobStatus.COMPLETED)
+        if broken:
+            job.status = JobStatus.CANCELLED
+            job.error = f"Dependency job(s) {broken} did not complete"
+            job.completed_at = now
+        elif remaining:
+            job.pending_dependencies = remaining
+        else:
+            self._make_pending(job, scheduled_for)
+        return self._snapshot(job)
+
+    async def get_job(self, job_id: int) -> Job | None:
+        job = self._jobs.get(job_id)
+        return self._snapshot(job) if job is not None else None
+
+    async def get_backlog(self) -> list[JobTypeBacklog]:
+        now = datetime.now()
+        oldest: dict[str, datetime] = {}
+        pending: Counter[str] = Counter()
+        for job in self._jobs.values():
+            if job.status == JobStatus.PENDING and job.scheduled_for <= now:
+                pending[job.job_type] += 1
+                oldest[job.job_type] = min(oldest.get(job.job_type, now), job.scheduled_for)
+        return [
+            JobTypeBacklog(
+                job_type=JobType(job_type),
+                pending=count,
+                oldest_pending_seconds=(now - oldest[job_type]).total_seconds(),
+            )
+            for job_type, count in pending.items()
+        ]
+
+    async def claim_jobs(
+        self, worker_id: str, n: int, job_types: list[JobType] | None = None
+    ) -> list[Job]:
+        if n <= 0:
+            return []
+
+        now = datetime.now()
+        self._promote_due(now)
+
+        # Same ordering as the Postgres claim: every type offers its n best
+        # candidates, ranked by weighted fair share and then by rank_at.
+        candidates: list[tuple[float, datetime, Job]] = []
+        for job_type in job_types or list(JobType):
+            weight = get_job_type_weight(job_type)
+            running = self._running[job_type.value]
+            for turn, job in enumerate(self._pop_ready(job_type.value, n), start=1):
+                share = (running + turn) / weight if settings.queue_fair_share else 0.0
+                candidates.append((share, job.rank_at, job))
+        candidates.sort(key=lambda candidate: (candidate[0], candidate[1], candidate[2].id))
+
+        for _, _, job in candidates[n:]:
+            heapq.heappush(self._ready[job.job_type], (job.rank_at, job.id))
+
+        claimed = [job for _, _, job in candidates[:n]]
+        for job in claimed:
+            self._set_status(job, JobStatus.PROCESSING)
+            job.worker_id = worker_id
+            job.started_at = now
+            job.attempts += 1
+            job.lease_expires_at = self._lease_deadline()
+
+        claimed.sort(key=lambda job: job.rank_at)
+        return [self._snapshot(job) for job in claimed]
+
+    async def release_jobs(self, job_ids: list[int]) -> None:
+        for job_id in job_ids:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.PROCESSING:
+                continue
+            job.attempts -= 1
+            job.worker_id = None
+            job.started_at = None
+            job.lease_expires_at = None
+            self._set_status(job, JobStatus.PENDING)
+            heapq.heappush(self._delayed, (job.scheduled_for, job.id))
+            self._notify(settings.queue_notify_channel, job.job_type)
+
+    async def requeue_job(self, job: Job) -> bool:
+        if not self._holds_lease(job):
+            return False
+        await self.release_jobs([job.id])
+        return True
+
+    async def renew_lease(self, job: Job) -> bool:
+        if not self._holds_lease(job):
+            return False
+        self._jobs[job.id].lease_expires_at = self._lease_deadline()
+        return True
+
+    def _holds_lease(self, job: Job) -> bool:
+        current = self._jobs.get(job.id)
+        return (
+            current is not None
+            and current.status == JobStatus.PROCESSING
+            and current.worker_id == job.worker_id
+            and current.attempts == job.attempts
+        )
+
+    async def reap_expired_jobs(self) -> int:
+        now = datetime.now()
+        expired = [
+            job
+            for job in self._jobs.values()
+            if job.status == JobStatus.PROCESSING and job.lease_expires_at < now
+        ]
+        for job in expired:
+            exhausted = job.attempts >= job.max_attempts
+            job.worker_id = None
+            job.lease_expires_at = None
+            if exhausted:
+                job.error = "Lease expired: worker stopped renewing, attempts exhausted"
+                self._set_status(job, JobStatus.FAILED)
+                self._cancel_dependents(job.id)
+            else:
+                job.error = "Lease expired: worker stopped renewing"
+                delay = get_retry_policy(JobType(job.job_type)).delay_seconds(job.attempts)
+                self._make_pending(job, now + timedelta(seconds=delay))
+        return len(expired)
+
+    def _lease_deadline(self) -> datetime:
+        return datetime.now() + timedelta(seconds=settings.queue_lease_seconds)
+
+    async def complete_job(self, job: Job, result: dict | None = None) -> None:
+        if not self._holds_lease(job):
+            return
+
+        job = self._jobs[job.id]
+        self._set_status(job, JobStatus.COMPLETED)
+        job.completed_at = datetime.now()
+        job.result = result or {}
+        job.lease_expires_at = None
+
+        for child_id in self._children.get(job.id, ()):
+            child = self._jobs[child_id]
+            if child.status != JobStatus.BLOCKED:
+                continue
+            child.pending_dependencies -= 1
+            if child.pending_dependencies <= 0:
+                self._make_pending(child, child.scheduled_for)
+
+    async def fail_job(self, job: Job, error: str) -> None:
+        if not self._holds_lease(job):
+            return
+
+        job = self._jobs[job.id]
+        job.error = error
+        job.worker_id = None
+        job.lease_expires_at = None
+        if job.attempts >= job.max_attempts:
+            self._set_status(job, JobStatus.FAILED)
+            job.completed_at = datetime.now()
+            self._cancel_dependents(job.id)
+        else:
+            delay = get_retry_policy(JobType(job.job_type)).delay_seconds(job.attempts)
+            self._make_pending(job, datetime.now() + timedelta(seconds=delay))
+
+    async def cancel_job(self, job_id: int) -> Job | None:
+        job = self._jobs.get(job_id)
+        if job is None or job.status not in ACTIVE_STATUSES:
+            return None
+
+        self._set_status(job, JobStatus.CANCELLED)
+        job.error = "Cancelled by request"
+        job.completed_at = datetime.now()
+        job.lease_expires_at = None
+        self._notify(settings.queue_cancel_channel, str(job_id))
+        self._cancel_dependents(job_id)
+        return self._snapshot(job)
+
+    def _cancel_dependents(self, job_id: int) -> None:
+        stack = list(self._children.get(job_id, ()))
+        while stack:
+            child = self._jobs[stack.pop()]
+            if child.status != JobStatus.BLOCKED:
+                continue
+            self._set_status(child, JobStatus.CANCELLED)
+            child.error = "Cancelled because a dependency did not complete"
+            child.completed_at = datetime.now()
+            stack.extend(self._children.get(child.id, ()))
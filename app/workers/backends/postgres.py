@@ -0,0 +1,65 @@
+from collections.abc import Awaitable, Callable
+
+from app.core.database import async_session_factory
+from app.enums import JobType
+from app.models import Job
+from app.schemas.job import JobTypeBacklog
+from app.services.queue_service import QueueService
+from app.workers.backends.base import QueueBackend
+
+
+class PostgresQueueBackend(QueueBackend):
+    name = "postgres"
+
+    async def _run[T](self, operation: Callable[[QueueService], Awaitable[T]]) -> T:
+        async with async_session_factory() as session:
+            result = await operation(QueueService(session))
+            await session.commit()
+        return result
+
+    async def enqueue(
+        self,
+        job_type: JobType,
+        payload: dict | None = None,
+        priority: int = 0,
+        delay_seconds: int = 0,
+        dedup_key: str | None = None,
+        depends_on: list[int] | None = None,
+    ) -> Job | None:
+        return await self._run(
+            lambda queue: queue.enqueue(
+                job_type, payload, priority, delay_seconds, dedup_key, depends_on
+            )
+        )
+
+    async def get_job(self, job_id: int) -> Job | None:
+        return await self._run(lambda queue: queue.get_job(job_id))
+
+    async def get_backlog(self) -> list[JobTypeBacklog]:
+        return await self._run(lambda queue: queue.get_backlog())
+
+    async def claim_jobs(
+        self, worker_id: str, n: int, job_types: list[JobType] | None = None
+    ) -> list[Job]:
+        return await self._run(lambda queue: queue.claim_jobs(worker_id, n, job_types))
+
+    async def release_jobs(self, job_ids: list[int]) -> None:
+        await self._run(lambda queue: queue.release_jobs(job_ids))
+
+    async def requeue_job(self, job: Job) -> bool:
+        return await self._run(lambda queue: queue.requeue_job(job))
+
+    async def renew_lease(self, job: Job) -> bool:
+        return await self._run(lambda queue: queue.renew_lease(job))
+
+    async def reap_expired_jobs(self) -> int:
+        return await self._run(lambda queue: queue.reap_expired_jobs())
+
+    async def complete_job(self, job: Job, result: dict | None = None) -> None:
+        await self._run(lambda queue: queue.complete_job(job, result))
+
+    async def fail_job(self, job: Job, error: str) -> None:
+        await self._run(lambda queue: queue.fail_job(job, error))
+
+    async def cancel_job(self, job_id: int) -> Job | None:
+        return await self._run(lambda queue: queue.cancel_job(job_id))
@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import JobType, ResourceClass
+from app.models import Job
+from app.workers.backends import MemoryQueueBackend
+from app.workers.manager import WorkerManager
+from app.workers.supervisor import LOG_FORMAT
+
+logging.basicConfig(
+    level=logging.WARNING,
+    format=LOG_FORMAT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def make_handler(handler_ms: float):
+    async def handle_noop(job: Job, session: AsyncSession) -> dict:
+        if handler_ms > 0:
+            await asyncio.sleep(handler_ms / 1000)
+        return {}
+
+    return handle_noop
+
+
+async def run_benchmark(num_jobs: int, workers: int, handler_ms: float) -> None:
+    backend = MemoryQueueBackend()
+    handler = make_handler(handler_ms)
+    manager = WorkerManager(
+        pool_sizes={resource_class: workers for resource_class in ResourceClass},
+        backend=backend,
+        handlers={job_type: handler for job_type in JobType},
+    )
+
+    job_types = list(JobType)
+    for i in range(num_jobs):
+        await backend.enqueue(job_types[i % len(job_types)], {"n": i}, priority=i % 3)
+
+    started = time.perf_counter()
+    await manager.start()
+    while True:
+        status = manager.status()
+        if status["completed"] + status["failed"] >= num_jobs:
+            break
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    await manager.stop()
+
+    print(
+        f"{status['completed']} completed, {status['failed']} failed in {elapsed:.2f}s "
+        f"with {manager.num_workers} worker(s): {num_jobs / elapsed:.0f} jobs/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure WorkerManager throughput on the in-memory queue backend"
+    )
+    parser.add_argument("--jobs", type=int, default=10000, help="Number of jobs to enqueue")
+    parser.add_argument("--workers", type=int, default=4, help="Workers per resource class")
+    parser.add_argument(
+        "--handler-ms", type=float, default=0.0, help="Simulated handler time per job"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.jobs, args.workers, args.handler_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import asyncio
+
+from app.models import Job
+
+
+class JobBuffer:
+    def __init__(self, prefetch: int = 0):
+        self.prefetch = prefetch
+        self._queue: asyncio.Queue[Job | None] = asyncio.Queue()
+        self._buffered: dict[int, Job] = {}
+        self._demand_event = asyncio.Event()
+        self._idle = 0
+        self._closed = False
+
+    @property
+    def demand(self) -> int:
+        if self._closed:
+            return 0
+        return max(0, self._idle + self.prefetch - self._queue.qsize())
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def size(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def jobs(self) -> list[Job]:
+        return list(self._buffered.values())
+
+    async def wait_for_demand(self) -> None:
+        while self.demand == 0 and not self._closed:
+            self._demand_event.clear()
+            await self._demand_event.wait()
+
+    async def get(self) -> Job | None:
+        if self._closed:
+            return None
+
+        self._idle += 1
+        self._demand_event.set()
+        try:
+            job = await self._queue.get()
+            if job is not None:
+                self._buffered.pop(job.id, None)
+            return job
+        finally:
+            self._idle -= 1
+
+    def put_many(self, jobs: list[Job]) -> None:
+        for job in jobs:
+            self._buffered[job.id] = job
+            self._queue.put_nowait(job)
+
+    def close(self) -> list[Job]:
+        self._closed = True
+        unclaimed: list[Job] = []
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            if job is not None:
+                unclaimed.append(job)
+        self._buffered.clear()
+
+        for _ in range(self._idle):
+            self._queue.put_nowait(None)
+        self._demand_event.set()
+        return unclaimed
@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+class SessionCheckpoint:
+    def __init__(
+        self,
+        db: AsyncSession,
+        every_items: int | None = None,
+        every_seconds: float | None = None,
+    ):
+        self.db = db
+        self.every_items = every_items or settings.job_checkpoint_items
+        self.every_seconds = every_seconds or settings.job_checkpoint_seconds
+        self._lock = asyncio.Lock()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+
+    async def add(self, instance: object) -> None:
+        async with self._lock:
+            self.db.add(instance)
+            await self._tick()
+
+    async def tick(self) -> None:
+        async with self._lock:
+            await self._tick()
+
+    async def commit(self) -> None:
+        async with self._lock:
+            await self._commit()
+
+    async def _tick(self) -> None:
+        self._pending += 1
+        elapsed = time.monotonic() - self._last_commit
+        if self._pending >= self.every_items or elapsed >= self.every_seconds:
+            await self._commit()
+
+    async def _commit(self) -> None:
+        await self.db.commit()
+        self._pending = 0
+        self._last_commit = time.monotonic()
@@ -1,21 +1,40 @@
+import argparse
 import asyncio
 import logging
 
 from app.core.config import settings
 from app.workers.manager import WorkerManager
+from app.workers.metrics import start_metrics_server
+from app.workers.supervisor import LOG_FORMAT, WorkerSupervisor
 
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    format=LOG_FORMAT,
 )
 
 logger = logging.getLogger(__name__)
 
 
 def main() -> None:
-    logger.info(f"Starting worker process with {settings.queue_workers} workers")
-    manager = WorkerManager(num_workers=settings.queue_workers)
-    asyncio.run(manager.run())
+    parser = argparse.ArgumentParser(description="Run StreamVault queue workers")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.queue_processes,
+        help="Number of worker processes, each with its own event loop and worker pools",
+    )
+    args = parser.parse_args()
+
+    logger.info(
+        f"Starting {args.processes} worker process(es) with {settings.queue_browser_workers} "
+        f"browser and {settings.queue_llm_workers} llm worker(s) each"
+    )
+
+    if args.processes > 1:
+        asyncio.run(WorkerSupervisor(num_processes=args.processes).run())
+    else:
+        start_metrics_server(settings.queue_metrics_port)
+        asyncio.run(WorkerManager().run())
 
 
 if __name__ == "__main__":
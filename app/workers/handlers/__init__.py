@@ -2,6 +2,7 @@ from collections.abc import Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.enums import JobType
 from app.models import Job
 
@@ -15,3 +16,13 @@ HANDLERS: dict[JobType, JobHandler] = {
     JobType.SCRAPE_POPULAR: handle_scrape_popular,
     JobType.VALIDATE_AND_STORE: handle_validate_and_store,
 }
+
+JOB_TIMEOUTS: dict[JobType, float] = {
+    JobType.SCRAPE_TOP_TEN: 900.0,
+    JobType.SCRAPE_POPULAR: 1800.0,
+    JobType.VALIDATE_AND_STORE: 3600.0,
+}
+
+
+def get_job_timeout(job_type: JobType) -> float:
+    return JOB_TIMEOUTS.get(job_type, settings.job_timeout_seconds)
@@ -1,5 +1,6 @@
 from datetime import date, datetime
 
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.enums import ShowType
@@ -7,50 +8,70 @@ from app.models import Job, ScrapedPopularShow, ScrapedTopShow
 from app.schemas.scrape import ScrapeShow
 from app.services.scraper_service import ScraperService
 from app.services.site_origins import get_site_origin
+from app.workers.checkpoint import SessionCheckpoint
+from app.workers.metrics import observe_page_ready
+from app.workers.progress import JobProgress
 
 
 def _create_top_show_record(
-    show: ScrapeShow, batch_sequence: int, show_type: ShowType
+    show: ScrapeShow, job: Job, batch_sequence: int, show_type: ShowType
 ) -> ScrapedTopShow:
     return ScrapedTopShow(
         tmdb_id=show.tmdb_id,
         position=show.position or 0,
         show_type=show_type,
         batch_sequence=batch_sequence,
+        job_id=job.id,
         details=show.model_dump(mode="json"),
     )
 
 
 def _create_popular_show_record(
-    show: ScrapeShow, batch_sequence: int, position: int
+    show: ScrapeShow, job: Job, batch_sequence: int, position: int
 ) -> ScrapedPopularShow:
     return ScrapedPopularShow(
         tmdb_id=show.tmdb_id,
         position=position,
         show_type=ShowType(show.show_type),
         batch_sequence=batch_sequence,
+        job_id=job.id,
         details=show.model_dump(mode="json"),
     )
 
 
+async def _start_batch(
+    job: Job, db: AsyncSession, model: type[ScrapedTopShow] | type[ScrapedPopularShow]
+) -> int:
+    # A rerun (drained or retried) replaces whatever the earlier run of the
+    # same job stored, so items are not written twice.
+    await db.execute(delete(model).where(model.job_id == job.id))
+    return int(datetime.now().timestamp())
+
+
 async def handle_scrape_top_ten(job: Job, db: AsyncSession) -> dict:
     origin_name = job.payload.get("origin", "justwatch")
     origin = get_site_origin(origin_name)
 
-    batch_sequence = int(datetime.now().timestamp())
+    batch_sequence = await _start_batch(job, db, ScrapedTopShow)
     counts = {"movies": 0, "series": 0}
+    checkpoint = SessionCheckpoint(db)
 
     async def on_item_ready(show: ScrapeShow, show_type: str) -> None:
         st = ShowType.MOVIE if show_type == "movie" else ShowType.SERIES
-        record = _create_top_show_record(show, batch_sequence, st)
-        db.add(record)
+        record = _create_top_show_record(show, job, batch_sequence, st)
+        await checkpoint.add(record)
         if show_type == "movie":
             counts["movies"] += 1
         else:
             counts["series"] += 1
 
-    scraper = ScraperService()
-    result = await scraper.extract_top_ten(origin=origin, on_item_ready=on_item_ready)
+    scraper = ScraperService(on_page_ready=observe_page_ready)
+    async with JobProgress(job) as progress:
+        result = await scraper.extract_top_ten(
+            origin=origin,
+            on_item_ready=on_item_ready,
+            on_progress=progress.increment,
+        )
 
     if result is None:
         return {
@@ -81,24 +102,27 @@ async def handle_scrape_popular(job: Job, db: AsyncSession) -> dict:
     download_cast_images = job.payload.get("download_cast_images", False)
     download_background_images = job.payload.get("download_background_images", False)
 
-    batch_sequence = int(datetime.now().timestamp())
+    batch_sequence = await _start_batch(job, db, ScrapedPopularShow)
     position_counter = {"value": 0}
+    checkpoint = SessionCheckpoint(db)
 
     async def on_item_ready(show: ScrapeShow) -> None:
         position_counter["value"] += 1
-        record = _create_popular_show_record(show, batch_sequence, position_counter["value"])
-        db.add(record)
-
-    scraper = ScraperService()
-    result = await scraper.extract_with_origin_detailed(
-        url=url,
-        origin=origin,
-        max_items=max_items,
-        download_tile_images=download_tile_images,
-        download_cast_images=download_cast_images,
-        download_background_images=download_background_images,
-        on_item_ready=on_item_ready,
-    )
+        record = _create_popular_show_record(show, job, batch_sequence, position_counter["value"])
+        await checkpoint.add(record)
+
+    scraper = ScraperService(on_page_ready=observe_page_ready)
+    async with JobProgress(job) as progress:
+        result = await scraper.extract_with_origin_detailed(
+            url=url,
+            origin=origin,
+            max_items=max_items,
+            download_tile_images=download_tile_images,
+            download_cast_images=download_cast_images,
+            download_background_images=download_background_images,
+            on_item_ready=on_item_ready,
+            on_progress=progress.increment,
+        )
 
     return {
         "url": url,
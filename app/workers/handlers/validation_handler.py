@@ -12,6 +12,8 @@ from app.schemas.tmdb import TMDBMovieSearchResult, TMDBTVSearchResult
 from app.schemas.validation import TMDBValidationResult
 from app.services.llm_service import LLMService
 from app.services.tmdb_service import TMDBService
+from app.workers.checkpoint import SessionCheckpoint
+from app.workers.progress import JobProgress
 
 logger = logging.getLogger(__name__)
 
@@ -101,13 +103,22 @@ async def handle_validate_and_store(job: Job, db: AsyncSession) -> dict:
 
     tmdb = TMDBService()
     llm = LLMService()
+    checkpoint = SessionCheckpoint(db)
+    progress = JobProgress(job)
 
     validated = 0
     skipped = 0
     needs_review_count = 0
 
     try:
-        for item in items:
+        for index, item in enumerate(items):
+            progress.update(
+                total=len(items),
+                processed=index,
+                validated=validated,
+                needs_review=needs_review_count,
+                skipped=skipped,
+            )
             details: dict = item.details
             title = details.get("title", "")
             show_type = details.get("show_type", "movie")
@@ -198,7 +209,7 @@ async def handle_validate_and_store(job: Job, db: AsyncSession) -> dict:
                 item.tmdb_id = tmdb_id_str
                 item.confidence = result.confidence
                 item.validation_status = new_status
-                await db.flush()
+                await checkpoint.tick()
 
                 if needs_review:
                     needs_review_count += 1
@@ -223,7 +234,14 @@ async def handle_validate_and_store(job: Job, db: AsyncSession) -> dict:
                 skipped += 1
                 continue
 
+        progress.update(
+            processed=len(items),
+            validated=validated,
+            needs_review=needs_review_count,
+            skipped=skipped,
+        )
     finally:
+        await progress.close()
         await tmdb.close()
 
     return {
@@ -1,50 +1,106 @@
 import asyncio
 import logging
+import os
 import signal
+import socket
+import time
 
 from app.core.config import settings
+from app.enums import JobType, ResourceClass
+from app.services.browser_pool import browser_pool
+from app.workers.backends import PostgresQueueBackend, QueueBackend
+from app.workers.handlers import JobHandler
+from app.workers.pool import WorkerPool, get_job_types, get_pool_sizes
 from app.workers.worker import Worker
 
 logger = logging.getLogger(__name__)
 
 
 class WorkerManager:
-    def __init__(self, num_workers: int | None = None):
-        self.num_workers = num_workers or settings.queue_workers
-        self.workers: list[Worker] = []
-        self._tasks: list[asyncio.Task[None]] = []
+    def __init__(
+        self,
+        pool_sizes: dict[ResourceClass, int] | None = None,
+        backend: QueueBackend | None = None,
+        handlers: dict[JobType, JobHandler] | None = None,
+    ):
+        self.pool_sizes = pool_sizes or get_pool_sizes()
+        self.manager_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.backend = backend or PostgresQueueBackend()
+        self.notifier = self.backend.create_notifier()
+        self.cancel_notifier = self.backend.create_notifier(settings.queue_cancel_channel)
+        self.pools: list[WorkerPool] = [
+            WorkerPool(
+                resource_class,
+                size,
+                self.manager_id,
+                self.notifier,
+                cancel_notifier=self.cancel_notifier,
+                backend=self.backend,
+                handlers=handlers,
+            )
+            for resource_class, size in self.pool_sizes.items()
+            if size > 0 and get_job_types(resource_class)
+        ]
+        self._reaper_task: asyncio.Task[None] | None = None
+        self._autoscale_task: asyncio.Task[None] | None = None
+        self._last_backlog: dict[ResourceClass, float] = {}
         self._shutdown_event = asyncio.Event()
 
+    @property
+    def workers(self) -> list[Worker]:
+        return [worker for pool in self.pools for worker in pool.workers]
+
+    @property
+    def num_workers(self) -> int:
+        return sum(pool.size for pool in self.pools)
+
+    def status(self) -> dict:
+        return {
+            "workers": len(self.workers),
+            "busy": sum(1 for worker in self.workers if worker.is_processing),
+            "buffered": sum(pool.buffer.size for pool in self.pools),
+            "completed": sum(worker.jobs_completed for worker in self.workers),
+            "failed": sum(worker.jobs_failed for worker in self.workers),
+            "cancelled": sum(worker.jobs_cancelled for worker in self.workers),
+            "requeued": sum(worker.jobs_requeued for worker in self.workers),
+        }
+
     async def start(self) -> None:
-        logger.info(f"[Manager] Starting {self.num_workers} worker(s)...")
+        logger.info(
+            f"[Manager] Starting {self.num_workers} worker(s) in {len(self.pools)} pool(s)..."
+        )
+
+        await self.notifier.start()
+        await self.cancel_notifier.start()
 
-        for i in range(self.num_workers):
-            worker = Worker(worker_id=f"worker-{i + 1}")
-            self.workers.append(worker)
-            task = asyncio.create_task(worker.start())
-            self._tasks.append(task)
+        for pool in self.pools:
+            await pool.start(pool.min_size if settings.queue_autoscale else pool.max_size)
+            self._last_backlog[pool.resource_class] = time.monotonic()
 
-        logger.info(f"[Manager] All {self.num_workers} worker(s) started and polling for jobs")
+        self._reaper_task = asyncio.create_task(self._reaper_loop())
+        if settings.queue_autoscale:
+            self._autoscale_task = asyncio.create_task(self._autoscale_loop())
 
-    async def stop(self, timeout: float = 30.0) -> None:
+        logger.info(f"[Manager] All {self.num_workers} worker(s) started and waiting for jobs")
+
+    async def stop(self, timeout: float | None = None) -> None:
+        timeout = timeout or settings.queue_shutdown_timeout
         logger.info("[Manager] Initiating graceful shutdown...")
 
-        for worker in self.workers:
-            worker.stop()
+        for task in (self._reaper_task, self._autoscale_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
 
-        if self._tasks:
-            logger.info(f"[Manager] Waiting up to {timeout}s for workers to finish current jobs...")
-            _, pending = await asyncio.wait(
-                self._tasks,
-                timeout=timeout,
-                return_when=asyncio.ALL_COMPLETED,
-            )
+        logger.info(
+            f"[Manager] Waiting up to {timeout}s for workers to finish current jobs, "
+            "then requeueing the rest..."
+        )
+        await asyncio.gather(*(pool.stop(timeout) for pool in self.pools))
 
-            if pending:
-                logger.warning(f"[Manager] {len(pending)} worker(s) still running, forcing cancel")
-                for task in pending:
-                    task.cancel()
-                await asyncio.gather(*pending, return_exceptions=True)
+        await self.notifier.stop()
+        await self.cancel_notifier.stop()
+        await browser_pool.close()
 
         logger.info("[Manager] All workers stopped, shutdown complete")
 
@@ -64,3 +120,56 @@ class WorkerManager:
     def _handle_signal(self) -> None:
         logger.info("[Manager] Received shutdown signal (SIGINT/SIGTERM)")
         self._shutdown_event.set()
+
+    async def _reaper_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.queue_reaper_interval)
+            try:
+                reaped = await self.backend.reap_expired_jobs()
+                if reaped:
+                    logger.warning(f"[Manager] Reaped {reaped} job(s) with expired leases")
+            except Exception as e:
+                logger.exception(f"[Manager] Failed to reap expired jobs: {e}")
+
+    async def _autoscale_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.queue_autoscale_interval)
+            try:
+                backlog = await self.backend.get_backlog()
+            except Exception as e:
+                logger.exception(f"[Manager] Failed to read queue backlog: {e}")
+                continue
+
+            by_type = {entry.job_type: entry for entry in backlog}
+            for pool in self.pools:
+                entries = [by_type[job_type] for job_type in pool.job_types if job_type in by_type]
+                pending = sum(entry.pending for entry in entries) + pool.buffer.size
+                oldest = max((entry.oldest_pending_seconds for entry in entries), default=0.0)
+
+                target = self._autoscale_target(pool, pending, oldest)
+                if target == pool.size:
+                    continue
+
+                before = pool.size
+                pool.scale_to(target)
+                if pool.size != before:
+                    logger.info(
+                        f"[Manager] Scaled {pool.name} from {before} to {pool.size} worker(s) "
+                        f"({pending} pending, oldest waiting {oldest:.0f}s)"
+                    )
+
+    def _autoscale_target(self, pool: WorkerPool, pending: int, oldest: float) -> int:
+        now = time.monotonic()
+        if pending > 0:
+            self._last_backlog[pool.resource_class] = now
+
+        # Grow only once jobs have actually waited, so a single enqueue that an
+        # idle worker picks up straight away does not spin up extra workers.
+        if pending > 0 and oldest >= settings.queue_autoscale_max_wait:
+            return max(pool.size, pool.busy + pending)
+
+        idle_for = now - self._last_backlog.get(pool.resource_class, now)
+        if pending == 0 and idle_for >= settings.queue_autoscale_idle_seconds:
+            return pool.busy
+
+        return pool.size
@@ -0,0 +1,89 @@
+import logging
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+from app.enums import JobType
+from app.models import Job
+
+logger = logging.getLogger(__name__)
+
+CLAIM_SECONDS = Histogram(
+    "streamvault_queue_claim_seconds",
+    "Round-trip time of a batch claim against the queue backend",
+    ["resource_class"],
+)
+CLAIMED_JOBS = Counter(
+    "streamvault_queue_claimed_jobs_total",
+    "Jobs claimed from the queue",
+    ["job_type"],
+)
+JOB_WAIT_SECONDS = Histogram(
+    "streamvault_job_wait_seconds",
+    "Seconds between a job becoming due and being claimed",
+    ["job_type"],
+    buckets=(0.1, 0.5, 1, 5, 15, 30, 60, 300, 900, 1800, 3600),
+)
+JOB_ATTEMPTS = Histogram(
+    "streamvault_job_attempts",
+    "Attempt number of claimed jobs",
+    ["job_type"],
+    buckets=(1, 2, 3, 5, 10),
+)
+JOB_DURATION_SECONDS = Histogram(
+    "streamvault_job_duration_seconds",
+    "Handler run time by job type and outcome",
+    ["job_type", "outcome"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 900, 1800, 3600),
+)
+JOBS_FINISHED = Counter(
+    "streamvault_jobs_finished_total",
+    "Handler runs by job type and outcome",
+    ["job_type", "outcome"],
+)
+WORKERS = Gauge(
+    "streamvault_workers",
+    "Worker slots per resource class pool",
+    ["resource_class"],
+)
+WORKERS_BUSY = Gauge(
+    "streamvault_workers_busy",
+    "Workers currently processing a job per resource class pool",
+    ["resource_class"],
+)
+PAGE_READY_SECONDS = Histogram(
+    "streamvault_scrape_page_ready_seconds",
+    "Seconds spent waiting for a scraped page to become ready",
+    ["origin", "page"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30),
+)
+
+
+def observe_claim(resource_class: str, elapsed: float, jobs: list[Job]) -> None:
+    CLAIM_SECONDS.labels(resource_class).observe(elapsed)
+    for job in jobs:
+        job_type = JobType(job.job_type).value
+        CLAIMED_JOBS.labels(job_type).inc()
+        JOB_ATTEMPTS.labels(job_type).observe(job.attempts)
+        if job.started_at is not None:
+            waited = (job.started_at - job.scheduled_for).total_seconds()
+            JOB_WAIT_SECONDS.labels(job_type).observe(max(waited, 0.0))
+
+
+def observe_job(job_type: JobType, outcome: str, elapsed: float) -> None:
+    JOB_DURATION_SECONDS.labels(job_type.value, outcome).observe(elapsed)
+    JOBS_FINISHED.labels(job_type.value, outcome).inc()
+
+
+def observe_page_ready(origin: str, page: str, elapsed: float) -> None:
+    PAGE_READY_SECONDS.labels(origin, page).observe(elapsed)
+
+
+def start_metrics_server(port: int) -> None:
+    if port <= 0:
+        return
+    try:
+        start_http_server(port)
+    except OSError as e:
+        logger.warning(f"[Metrics] Could not listen on port {port}: {e}")
+        return
+    logger.info(f"[Metrics] Serving worker metrics on :{port}/metrics")
@@ -0,0 +1,107 @@
+import asyncio
+import contextlib
+import logging
+
+import asyncpg
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueueNotifier:
+    def __init__(self, channel: str | None = None, listen: bool = True):
+        self.channel = channel or settings.queue_notify_channel
+        self.listen = listen
+        self._subscribers: dict[asyncio.Event, set[str] | None] = {}
+        self._connection: asyncpg.Connection | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_listening(self) -> bool:
+        # Without LISTEN every wake comes straight from the in-process backend.
+        if not self.listen:
+            return True
+        return self._connection is not None and not self._connection.is_closed()
+
+    @property
+    def wait_timeout(self) -> float:
+        if self.is_listening:
+            return settings.queue_fallback_poll_interval
+        return settings.queue_poll_interval
+
+    def subscribe(self, job_types: set[str] | None = None) -> asyncio.Event:
+        event = asyncio.Event()
+        self._subscribers[event] = job_types
+        return event
+
+    def unsubscribe(self, event: asyncio.Event) -> None:
+        self._subscribers.pop(event, None)
+
+    def wake_all(self) -> None:
+        for event in self._subscribers:
+            event.set()
+
+    def wake(self, job_type: str) -> None:
+        for event, job_types in self._subscribers.items():
+            if job_types is None or job_type in job_types:
+                event.set()
+
+    async def wait(self, event: asyncio.Event, timeout: float | None = None) -> bool:
+        if timeout is None:
+            timeout = self.wait_timeout
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except TimeoutError:
+            return False
+
+    async def start(self) -> None:
+        if self.listen and self._task is None:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self.wake_all()
+
+    async def _listen_forever(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+                logger.warning("[Notifier] LISTEN connection lost, falling back to polling")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[Notifier] Could not LISTEN on '{self.channel}': {e}")
+
+            await asyncio.sleep(settings.queue_listen_reconnect_delay)
+
+    async def _listen_once(self) -> None:
+        connection = await asyncpg.connect(settings.database_url_sync)
+        lost = asyncio.Event()
+        try:
+            connection.add_termination_listener(lambda _: lost.set())
+            await connection.add_listener(self.channel, self._on_notification)
+            self._connection = connection
+            logger.info(f"[Notifier] Listening on channel '{self.channel}'")
+
+            # Anything enqueued while we were disconnected never produced a
+            # notification we could see, so let subscribers re-check once.
+            self.wake_all()
+            await lost.wait()
+        finally:
+            self._connection = None
+            if not connection.is_closed():
+                with contextlib.suppress(Exception):
+                    await connection.close()
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        if payload:
+            self.wake(payload)
+        else:
+            self.wake_all()
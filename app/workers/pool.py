@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import time
+
+from app.core.config import settings
+from app.enums import JobType, ResourceClass
+from app.models import Job
+from app.workers.backends import PostgresQueueBackend, QueueBackend
+from app.workers.buffer import JobBuffer
+from app.workers.handlers import JobHandler
+from app.workers.metrics import WORKERS, WORKERS_BUSY, observe_claim
+from app.workers.notifier import QueueNotifier
+from app.workers.worker import Worker
+
+logger = logging.getLogger(__name__)
+
+JOB_RESOURCE_CLASSES: dict[JobType, ResourceClass] = {
+    JobType.SCRAPE_TOP_TEN: ResourceClass.BROWSER,
+    JobType.SCRAPE_POPULAR: ResourceClass.BROWSER,
+    JobType.VALIDATE_AND_STORE: ResourceClass.LLM,
+}
+
+
+def get_resource_class(job_type: JobType) -> ResourceClass:
+    return JOB_RESOURCE_CLASSES[job_type]
+
+
+def get_job_types(resource_class: ResourceClass) -> list[JobType]:
+    return [job_type for job_type in JobType if get_resource_class(job_type) == resource_class]
+
+
+def get_pool_sizes() -> dict[ResourceClass, int]:
+    return {
+        ResourceClass.BROWSER: settings.queue_browser_workers,
+        ResourceClass.LLM: settings.queue_llm_workers,
+    }
+
+
+class WorkerPool:
+    def __init__(
+        self,
+        resource_class: ResourceClass,
+        max_size: int,
+        owner_id: str,
+        notifier: QueueNotifier,
+        min_size: int | None = None,
+        cancel_notifier: QueueNotifier | None = None,
+        backend: QueueBackend | None = None,
+        handlers: dict[JobType, JobHandler] | None = None,
+    ):
+        self.resource_class = resource_class
+        self.max_size = max_size
+        self.min_size = min(max_size, settings.queue_min_workers if min_size is None else min_size)
+        self.owner_id = owner_id
+        self.notifier = notifier
+        self.cancel_notifier = cancel_notifier
+        self.backend = backend or PostgresQueueBackend()
+        self.handlers = handlers
+        self.job_types = get_job_types(resource_class)
+        self.buffer = JobBuffer(prefetch=settings.queue_prefetch)
+        self.workers: list[Worker] = []
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._prefetch_task: asyncio.Task[None] | None = None
+        self._renew_task: asyncio.Task[None] | None = None
+        self._next_worker = 1
+
+    @property
+    def name(self) -> str:
+        return f"Pool:{self.resource_class.value}"
+
+    @property
+    def size(self) -> int:
+        return len(self.workers)
+
+    @property
+    def busy(self) -> int:
+        return sum(1 for worker in self.workers if worker.is_processing)
+
+    async def start(self, size: int | None = None) -> None:
+        WORKERS.labels(self.resource_class.value).set_function(lambda: self.size)
+        WORKERS_BUSY.labels(self.resource_class.value).set_function(lambda: self.busy)
+        self._add_workers(self.max_size if size is None else size)
+        self._prefetch_task = asyncio.create_task(self._prefetch_loop())
+        self._renew_task = asyncio.create_task(self._renew_buffered_loop())
+
+        logger.info(
+            f"[{self.name}] Started {self.size} worker(s) for "
+            f"{', '.join(job_type.value for job_type in self.job_types)}"
+        )
+
+    def scale_to(self, target: int) -> None:
+        target = max(self.min_size, min(self.max_size, target))
+        if target > self.size:
+            self._add_workers(target - self.size)
+        elif target < self.size:
+            self._retire_idle(self.size - target)
+
+    def _add_workers(self, count: int) -> None:
+        for _ in range(count):
+            worker = Worker(
+                buffer=self.buffer,
+                worker_id=f"{self.resource_class.value}-worker-{self._next_worker}",
+                cancel_notifier=self.cancel_notifier,
+                backend=self.backend,
+                handlers=self.handlers,
+            )
+            self._next_worker += 1
+            self.workers.append(worker)
+            self._tasks[worker.worker_id] = asyncio.create_task(worker.start())
+
+    def _retire_idle(self, count: int) -> None:
+        idle = [worker for worker in self.workers if not worker.is_processing][:count]
+        for worker in idle:
+            worker.stop()
+            self._tasks.pop(worker.worker_id).cancel()
+            self.workers.remove(worker)
+
+    async def stop(self, timeout: float, drain_timeout: float | None = None) -> None:
+        drain_timeout = settings.queue_drain_timeout if drain_timeout is None else drain_timeout
+
+        # Stop claiming first: nothing new is taken and buffered jobs go back
+        # to the queue untouched, so other processes can start them right away.
+        for worker in self.workers:
+            worker.stop()
+
+        await self._release_buffered(self.buffer.close())
+        if self._renew_task is not None:
+            self._renew_task.cancel()
+            await asyncio.gather(self._renew_task, return_exceptions=True)
+
+        if self._prefetch_task is not None:
+            self.notifier.wake_all()
+            await asyncio.gather(self._prefetch_task, return_exceptions=True)
+
+        pending = await self._wait_for_workers(timeout)
+        if not pending:
+            return
+
+        # Jobs that did not finish within the grace period are checkpointed and
+        # requeued without being charged an attempt.
+        busy = [worker for worker in self.workers if worker.is_processing]
+        logger.warning(f"[{self.name}] Draining {len(busy)} running job(s) back to the queue")
+        for worker in busy:
+            worker.drain()
+
+        pending = await self._wait_for_workers(drain_timeout)
+        if pending:
+            logger.warning(f"[{self.name}] {len(pending)} worker(s) still running, forcing cancel")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _wait_for_workers(self, timeout: float) -> set[asyncio.Task[None]]:
+        if not self._tasks:
+            return set()
+
+        _, pending = await asyncio.wait(
+            self._tasks.values(),
+            timeout=timeout,
+            return_when=asyncio.ALL_COMPLETED,
+        )
+        return pending
+
+    async def _prefetch_loop(self) -> None:
+        wakeup = self.notifier.subscribe({job_type.value for job_type in self.job_types})
+        try:
+            while not self.buffer.closed:
+                await self.buffer.wait_for_demand()
+                if self.buffer.closed:
+                    break
+                wakeup.clear()
+
+                wanted = min(self.buffer.demand, settings.queue_claim_batch_size)
+                try:
+                    jobs = await self._claim(wanted)
+                except Exception as e:
+                    logger.exception(f"[{self.name}] Failed to claim jobs: {e}")
+                    await asyncio.sleep(settings.queue_poll_interval)
+                    continue
+
+                if self.buffer.closed:
+                    await self._release_buffered(jobs)
+                    break
+                self.buffer.put_many(jobs)
+
+                # A full batch means there is probably more work waiting, so go
+                # straight back for it instead of waiting for the next NOTIFY.
+                if len(jobs) < wanted:
+                    await self.notifier.wait(wakeup)
+        finally:
+            self.notifier.unsubscribe(wakeup)
+
+    async def _renew_buffered_loop(self) -> None:
+        # Prefetched jobs are already claimed, so their leases are kept alive
+        # here until a worker takes them and its own heartbeat starts.
+        while not self.buffer.closed:
+            await asyncio.sleep(settings.queue_heartbeat_interval)
+            for job in self.buffer.jobs:
+                try:
+                    renewed = await self.backend.renew_lease(job)
+                except Exception as e:
+                    logger.warning(
+                        f"[{self.name}] Job {job.id}: Failed to renew buffered lease: {e}"
+                    )
+                    continue
+                if not renewed:
+                    logger.warning(f"[{self.name}] Job {job.id}: Lease lost while buffered")
+
+    async def _claim(self, n: int) -> list[Job]:
+        started = time.perf_counter()
+        jobs = await self.backend.claim_jobs(self.owner_id, n, self.job_types)
+        observe_claim(self.resource_class.value, time.perf_counter() - started, jobs)
+
+        if jobs:
+            logger.debug(f"[{self.name}] Claimed {len(jobs)} job(s) into the local buffer")
+        return jobs
+
+    async def _release_buffered(self, jobs: list[Job]) -> None:
+        if not jobs:
+            return
+
+        try:
+            await self.backend.release_jobs([job.id for job in jobs])
+            logger.info(f"[{self.name}] Returned {len(jobs)} buffered job(s) to the queue")
+        except Exception as e:
+            logger.exception(f"[{self.name}] Failed to release buffered jobs: {e}")
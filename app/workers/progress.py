@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import time
+
+from app.core.config import settings
+from app.core.database import async_session_factory
+from app.models import Job
+from app.services.queue_service import QueueService
+
+logger = logging.getLogger(__name__)
+
+
+class JobProgress:
+    def __init__(self, job: Job, every_seconds: float | None = None):
+        self.job = job
+        self.every_seconds = every_seconds or settings.job_progress_interval
+        self.counts: dict[str, int] = {}
+        self._dirty = False
+        self._last_flush = 0.0
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "JobProgress":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def increment(self, key: str, amount: int = 1) -> None:
+        self.counts[key] = self.counts.get(key, 0) + amount
+        self._mark_dirty()
+
+    def update(self, **counts: int) -> None:
+        self.counts.update(counts)
+        self._mark_dirty()
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        if not self._dirty:
+            return
+
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        try:
+            # Fenced on the lease like complete_job, so a worker that lost the
+            # job does not overwrite the progress of its new owner.
+            async with async_session_factory() as session:
+                stored = await QueueService(session).store_progress(self.job, dict(self.counts))
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"[Progress] Job {self.job.id}: Failed to store progress: {e}")
+            return
+        if not stored:
+            logger.warning(f"[Progress] Job {self.job.id}: Lease lost, progress not stored")
+
+    def _mark_dirty(self) -> None:
+        # Counters change on every item, so writes are coalesced into at most
+        # one UPDATE per interval instead of one per increment.
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        delay = self._last_flush + self.every_seconds - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self.flush()
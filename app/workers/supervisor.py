@@ -0,0 +1,164 @@
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import queue
+import signal
+import time
+from multiprocessing.context import SpawnProcess
+from multiprocessing.queues import Queue
+
+from app.core.config import settings
+from app.workers.manager import WorkerManager
+from app.workers.metrics import start_metrics_server
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _run_child(index: int, status_queue: Queue) -> None:
+    logging.basicConfig(level=logging.INFO, format=f"[proc-{index}] {LOG_FORMAT}", force=True)
+    asyncio.run(_child_main(index, status_queue))
+
+
+async def _child_main(index: int, status_queue: Queue) -> None:
+    # Each process has its own registry, so each one serves metrics on its own port.
+    if settings.queue_metrics_port > 0:
+        start_metrics_server(settings.queue_metrics_port + index - 1)
+    manager = WorkerManager()
+    reporter = asyncio.create_task(_report_status(index, manager, status_queue))
+    try:
+        await manager.run()
+    finally:
+        reporter.cancel()
+        await asyncio.gather(reporter, return_exceptions=True)
+        status_queue.put((index, manager.status()))
+
+
+async def _report_status(index: int, manager: WorkerManager, status_queue: Queue) -> None:
+    while True:
+        await asyncio.sleep(settings.queue_status_interval)
+        status_queue.put((index, manager.status()))
+
+
+class WorkerSupervisor:
+    def __init__(self, num_processes: int | None = None):
+        self.num_processes = num_processes or settings.queue_processes
+        self._context = multiprocessing.get_context("spawn")
+        self._status_queue: Queue = self._context.Queue()
+        self._processes: dict[int, SpawnProcess] = {}
+        self._statuses: dict[int, dict] = {}
+        self._restarts = 0
+        self._shutdown_event = asyncio.Event()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._handle_signal)
+
+        logger.info(f"[Supervisor] Starting {self.num_processes} worker process(es)...")
+        for index in range(1, self.num_processes + 1):
+            self._spawn(index)
+
+        last_report = time.monotonic()
+        while not self._shutdown_event.is_set():
+            await self._restart_crashed()
+            self._drain_statuses()
+
+            if time.monotonic() - last_report >= settings.queue_status_interval:
+                self._log_status()
+                last_report = time.monotonic()
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._shutdown_event.wait(), timeout=1.0)
+
+        await self.stop()
+
+    async def stop(self) -> None:
+        logger.info("[Supervisor] Forwarding shutdown to worker processes...")
+        for process in self._processes.values():
+            if process.is_alive():
+                process.terminate()
+
+        deadline = (
+            time.monotonic() + settings.queue_shutdown_timeout + settings.queue_drain_timeout + 15.0
+        )
+        while any(p.is_alive() for p in self._processes.values()):
+            if time.monotonic() >= deadline:
+                for process in self._processes.values():
+                    if process.is_alive():
+                        logger.warning(f"[Supervisor] Killing unresponsive process {process.pid}")
+                        process.kill()
+                break
+            await asyncio.sleep(0.5)
+
+        for process in self._processes.values():
+            process.join(timeout=5.0)
+
+        self._drain_statuses()
+        self._log_status()
+        logger.info("[Supervisor] All worker processes stopped")
+
+    def _spawn(self, index: int) -> None:
+        process = self._context.Process(
+            target=_run_child,
+            args=(index, self._status_queue),
+            name=f"streamvault-worker-{index}",
+        )
+        process.start()
+        self._processes[index] = process
+        logger.info(f"[Supervisor] Started worker process {index} (pid={process.pid})")
+
+    async def _restart_crashed(self) -> None:
+        for index, process in list(self._processes.items()):
+            if process.is_alive() or self._shutdown_event.is_set():
+                continue
+
+            logger.error(
+                f"[Supervisor] Worker process {index} (pid={process.pid}) exited with code "
+                f"{process.exitcode}, restarting in {settings.queue_process_restart_delay}s"
+            )
+            process.close()
+            del self._processes[index]
+            self._statuses.pop(index, None)
+            await asyncio.sleep(settings.queue_process_restart_delay)
+            if not self._shutdown_event.is_set():
+                self._restarts += 1
+                self._spawn(index)
+
+    def _drain_statuses(self) -> None:
+        while True:
+            try:
+                index, status = self._status_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._statuses[index] = status
+
+    def _log_status(self) -> None:
+        alive = sum(1 for process in self._processes.values() if process.is_alive())
+        totals = {
+            "workers": 0,
+            "busy": 0,
+            "buffered": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "requeued": 0,
+        }
+        for status in self._statuses.values():
+            for key in totals:
+                totals[key] += status.get(key, 0)
+
+        logger.info(
+            f"[Supervisor] {alive}/{self.num_processes} process(es) alive, "
+            f"{totals['busy']}/{totals['workers']} worker(s) busy, "
+            f"{totals['buffered']} buffered, {totals['completed']} completed, "
+            f"{totals['failed']} failed, {totals['cancelled']} cancelled, "
+            f"{totals['requeued']} requeued, {self._restarts} restart(s)"
+        )
+
+    def _handle_signal(self) -> None:
+        logger.info("[Supervisor] Received shutdown signal (SIGINT/SIGTERM)")
+        self._shutdown_event.set()
@@ -1,45 +1,73 @@
 import asyncio
+import contextlib
 import logging
 import time
 import traceback
 import uuid
 
-from sqlalchemy.ext.asyncio import AsyncSession
-
 from app.core.config import settings
 from app.core.database import async_session_factory
-from app.enums import JobType
+from app.enums import JobStatus, JobType
 from app.models import Job
-from app.services.queue_service import QueueService
-from app.workers.handlers import HANDLERS
+from app.workers.backends import PostgresQueueBackend, QueueBackend
+from app.workers.buffer import JobBuffer
+from app.workers.handlers import HANDLERS, JobHandler, get_job_timeout
+from app.workers.metrics import observe_job
+from app.workers.notifier import QueueNotifier
 
 logger = logging.getLogger(__name__)
 
+ABORT_LEASE_LOST = "lease_lost"
+ABORT_CANCELLED = "cancelled"
+ABORT_TIMEOUT = "timeout"
+ABORT_DRAIN = "drain"
+OUTCOME_COMPLETED = "completed"
+OUTCOME_FAILED = "failed"
+
 
 class Worker:
-    def __init__(self, worker_id: str | None = None):
+    def __init__(
+        self,
+        buffer: JobBuffer,
+        worker_id: str | None = None,
+        cancel_notifier: QueueNotifier | None = None,
+        backend: QueueBackend | None = None,
+        handlers: dict[JobType, JobHandler] | None = None,
+    ):
         self.worker_id = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
+        self.buffer = buffer
+        self.cancel_notifier = cancel_notifier
+        self.backend = backend or PostgresQueueBackend()
+        self.handlers = HANDLERS if handlers is None else handlers
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.jobs_cancelled = 0
+        self.jobs_requeued = 0
         self._stop_event = asyncio.Event()
         self._current_job: Job | None = None
+        self._handler_task: asyncio.Task[dict] | None = None
+        self._abort_reason: str | None = None
 
     async def start(self) -> None:
-        logger.info(
-            f"[{self.worker_id}] Worker starting, polling every {settings.queue_poll_interval}s"
-        )
+        logger.info(f"[{self.worker_id}] Worker starting, waiting for jobs")
 
         while not self._stop_event.is_set():
             try:
-                async with async_session_factory() as session:
-                    queue = QueueService(session)
-                    job = await queue.claim_job(self.worker_id)
-
-                    if job:
-                        self._current_job = job
-                        await self._process_job(job, queue, session)
-                        self._current_job = None
-                        await session.commit()
+                job = await self.buffer.get()
+                if job is None:
+                    continue
+
+                self._current_job = job
+                try:
+                    if await self._renew_lease(job):
+                        await self._process_job(job)
                     else:
-                        await asyncio.sleep(settings.queue_poll_interval)
+                        logger.warning(
+                            f"[{self.worker_id}] Job {job.id}: Lease expired while buffered, "
+                            "skipping"
+                        )
+                finally:
+                    self._current_job = None
 
             except asyncio.CancelledError:
                 logger.info(f"[{self.worker_id}] Worker cancelled")
@@ -50,12 +78,12 @@ class Worker:
 
         logger.info(f"[{self.worker_id}] Worker stopped")
 
-    async def _process_job(self, job: Job, queue: QueueService, session: AsyncSession) -> None:
+    async def _process_job(self, job: Job) -> None:
         job_type = JobType(job.job_type)
-        handler = HANDLERS.get(job_type)
+        handler = self.handlers.get(job_type)
 
         if handler is None:
-            await queue.fail_job(job.id, f"No handler for job type: {job_type}")
+            await self._fail(job, f"No handler for job type: {job_type}")
             logger.error(f"[{self.worker_id}] Job {job.id}: No handler for type '{job_type}'")
             return
 
@@ -65,26 +93,166 @@ class Worker:
         )
 
         start_time = time.perf_counter()
+        timeout = get_job_timeout(job_type)
+        self._abort_reason = None
+        handler_task = asyncio.create_task(self._run_handler(handler, job))
+        self._handler_task = handler_task
+        watchdogs = [
+            asyncio.create_task(self._heartbeat(job, handler_task)),
+            asyncio.create_task(self._watch_cancel(job, handler_task)),
+            asyncio.create_task(self._enforce_timeout(timeout, handler_task)),
+        ]
 
         try:
-            result = await handler(job, session)
+            result = await handler_task
             elapsed = time.perf_counter() - start_time
-            await queue.complete_job(job.id, result)
+            await self._complete(job, result)
+            self.jobs_completed += 1
+            observe_job(job_type, OUTCOME_COMPLETED, elapsed)
             logger.info(
                 f"[{self.worker_id}] Job {job.id}: Completed in {elapsed:.2f}s (result={result})"
             )
+        except asyncio.CancelledError:
+            if self._abort_reason is None:
+                raise
+            elapsed = time.perf_counter() - start_time
+            observe_job(job_type, self._abort_reason, elapsed)
+            if self._abort_reason == ABORT_TIMEOUT:
+                await self._fail(job, f"TimeoutError: Job exceeded its {timeout:.0f}s timeout")
+                self.jobs_failed += 1
+                logger.error(
+                    f"[{self.worker_id}] Job {job.id}: Timed out after {elapsed:.2f}s "
+                    f"(limit {timeout:.0f}s)"
+                )
+            elif self._abort_reason == ABORT_DRAIN:
+                await self._requeue(job, elapsed)
+            elif self._abort_reason == ABORT_CANCELLED:
+                self.jobs_cancelled += 1
+                logger.warning(f"[{self.worker_id}] Job {job.id}: Cancelled after {elapsed:.2f}s")
+            else:
+                logger.error(
+                    f"[{self.worker_id}] Job {job.id}: Abandoned after {elapsed:.2f}s, "
+                    "lease was lost"
+                )
         except Exception as e:
             elapsed = time.perf_counter() - start_time
             error_msg = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
-            await queue.fail_job(job.id, error_msg)
+            await self._fail(job, error_msg)
+            self.jobs_failed += 1
+            observe_job(job_type, OUTCOME_FAILED, elapsed)
             logger.error(
                 f"[{self.worker_id}] Job {job.id}: Failed after {elapsed:.2f}s - "
                 f"{type(e).__name__}: {e}"
             )
+        finally:
+            self._handler_task = None
+            for task in watchdogs:
+                task.cancel()
+            await asyncio.gather(*watchdogs, return_exceptions=True)
+
+    def _abort(self, handler_task: asyncio.Task[dict], reason: str) -> None:
+        # Cancelling the handler unwinds its finally blocks, which close Playwright
+        # pages and browsers and drop in-flight LLM/HTTP requests.
+        if self._abort_reason is None and not handler_task.done():
+            self._abort_reason = reason
+            handler_task.cancel()
+
+    async def _run_handler(self, handler: JobHandler, job: Job) -> dict:
+        async with async_session_factory() as session:
+            try:
+                result = await handler(job, session)
+            except asyncio.CancelledError:
+                # A drained job resumes elsewhere, so checkpoint what it has stored.
+                if self._abort_reason == ABORT_DRAIN:
+                    with contextlib.suppress(Exception):
+                        await session.commit()
+                raise
+            except Exception:
+                # Keep whatever the handler already produced since its last checkpoint.
+                with contextlib.suppress(Exception):
+                    await session.commit()
+                raise
+            await session.commit()
+        return result
+
+    async def _complete(self, job: Job, result: dict) -> None:
+        await self.backend.complete_job(job, result)
+
+    async def _fail(self, job: Job, error: str) -> None:
+        await self.backend.fail_job(job, error)
+
+    async def _requeue(self, job: Job, elapsed: float) -> None:
+        try:
+            requeued = await self.backend.requeue_job(job)
+        except Exception as e:
+            logger.exception(f"[{self.worker_id}] Job {job.id}: Failed to requeue on drain: {e}")
+            return
+
+        if requeued:
+            self.jobs_requeued += 1
+            logger.warning(
+                f"[{self.worker_id}] Job {job.id}: Drained after {elapsed:.2f}s, "
+                "returned to the queue without using an attempt"
+            )
+        else:
+            logger.warning(
+                f"[{self.worker_id}] Job {job.id}: Drained after {elapsed:.2f}s, "
+                "lease was already lost"
+            )
+
+    async def _heartbeat(self, job: Job, handler_task: asyncio.Task[dict]) -> None:
+        while not handler_task.done():
+            await asyncio.sleep(settings.queue_heartbeat_interval)
+            try:
+                renewed = await self._renew_lease(job)
+            except Exception as e:
+                logger.warning(f"[{self.worker_id}] Job {job.id}: Failed to renew lease: {e}")
+                continue
+
+            if not renewed:
+                logger.error(
+                    f"[{self.worker_id}] Job {job.id}: Lease lost (reaped or cancelled), stopping"
+                )
+                self._abort(handler_task, ABORT_LEASE_LOST)
+                return
+
+    async def _watch_cancel(self, job: Job, handler_task: asyncio.Task[dict]) -> None:
+        if self.cancel_notifier is None:
+            return
+
+        wakeup = self.cancel_notifier.subscribe({str(job.id)})
+        try:
+            while not handler_task.done():
+                await self.cancel_notifier.wait(wakeup)
+                wakeup.clear()
+
+                # wake_all() also fires on reconnects, and while LISTEN is down
+                # no wakeup arrives at all, so the row is checked either way.
+                try:
+                    current = await self.backend.get_job(job.id)
+                except Exception as e:
+                    logger.warning(f"[{self.worker_id}] Job {job.id}: Failed to check status: {e}")
+                    continue
+                if current is not None and current.status == JobStatus.CANCELLED:
+                    self._abort(handler_task, ABORT_CANCELLED)
+                    return
+        finally:
+            self.cancel_notifier.unsubscribe(wakeup)
+
+    async def _enforce_timeout(self, timeout: float, handler_task: asyncio.Task[dict]) -> None:
+        await asyncio.sleep(timeout)
+        self._abort(handler_task, ABORT_TIMEOUT)
+
+    async def _renew_lease(self, job: Job) -> bool:
+        return await self.backend.renew_lease(job)
 
     def stop(self) -> None:
         self._stop_event.set()
 
+    def drain(self) -> None:
+        if self._handler_task is not None:
+            self._abort(self._handler_task, ABORT_DRAIN)
+
     @property
     def is_processing(self) -> bool:
         return self._current_job is not None
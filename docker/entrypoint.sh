@@ -31,7 +31,7 @@ case "$1" in
         exec uvicorn app.main:app --host 0.0.0.0 --port 8000
         ;;
     worker)
-        echo "Starting ${QUEUE_WORKERS:-2} worker(s)..."
+        echo "Starting workers (browser=${QUEUE_BROWSER_WORKERS:-1}, llm=${QUEUE_LLM_WORKERS:-1})..."
         exec python -m app.workers.cli
         ;;
     scheduler)
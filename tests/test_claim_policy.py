@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.enums import JobType
+from app.services.claim_policy import JOB_TYPE_WEIGHTS, get_job_type_weight, rank_at
+
+
+def test_waiting_job_overtakes_higher_priority_after_aging() -> None:
+    now = datetime(2026, 1, 1, 12, 0)
+    aging = timedelta(seconds=settings.queue_aging_seconds)
+    fresh_urgent = rank_at(now, priority=2)
+    old_normal = rank_at(now - 3 * aging, priority=0)
+    assert old_normal < fresh_urgent
+
+
+def test_unknown_job_types_get_default_weight(monkeypatch) -> None:
+    assert get_job_type_weight(JobType.VALIDATE_AND_STORE) == 2.0
+    monkeypatch.delitem(JOB_TYPE_WEIGHTS, JobType.VALIDATE_AND_STORE)
+    assert get_job_type_weight(JobType.VALIDATE_AND_STORE) == 1.0
@@ -0,0 +1,82 @@
+from app.schemas.scrape import ScrapeShow, ShowType
+from app.services.site_origins.justwatch import SiteOriginJustWatch
+
+DETAIL_HTML = """<html><head>
+<script type="application/ld+json">{"@type": "BreadcrumbList"}</script>
+<script type="application/ld+json">
+{"@type": "Movie", "name": "Dune", "description": "Spice.",
+ "actor": [{"@type": "PerformanceRole", "actor": {"name": "Zendaya"}}, {"name": "Josh Brolin"}]}
+</script>
+</head><body>
+<div class="title-credits__actor">
+  <img src="https://images.justwatch.com/portrait/1/zendaya.webp" alt="">
+  <a href="/us/person/zendaya"><span class="title-credit-name">Zendaya</span></a>
+</div>
+<div class="title-credits__actor">
+  <img src="data:image/gif;base64,R0lGOD">
+  <span class="title-credit-name"> Josh <b>Brolin</b> </span>
+</div>
+</body></html>"""
+
+
+def test_detail_html_reads_json_ld_and_cast_portraits() -> None:
+    base = ScrapeShow(show_type=ShowType.MOVIE, title="Dune", slug="dune")
+    show = SiteOriginJustWatch().extract_detail_html(DETAIL_HTML, base)
+
+    assert show is not None
+    assert show.overview == "Spice."
+    assert [(m.name, m.image_url) for m in show.cast] == [
+        ("Zendaya", "https://images.justwatch.com/portrait/1/zendaya.webp"),
+        ("Josh Brolin", None),
+    ]
+
+
+def test_detail_html_without_json_ld_falls_back() -> None:
+    base = ScrapeShow(show_type=ShowType.MOVIE, title="Dune", slug="dune")
+    assert SiteOriginJustWatch().extract_detail_html("<html></html>", base) is None
+
+
+class FakePage:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+
+    async def evaluate(self, expression: str, arg=None):
+        self.calls += 1
+        return self.payload
+
+
+async def test_top_ten_is_built_from_one_evaluate() -> None:
+    link = {"href": "/us/tv-show/severance", "image": "https://images.justwatch.com/poster/1.jpg"}
+    page = FakePage(
+        [
+            {"header": "Top 10 movies", "links": [{"href": "/us/movie/dune", "image": None}] * 12},
+            {"header": "Top 10 TV shows", "links": [{"href": None, "image": None}, link]},
+            {"header": "Popular", "links": [link]},
+        ]
+    )
+    result = await SiteOriginJustWatch().extract_top_ten(page)
+
+    assert page.calls == 1
+    assert len(result.movies.items) == 10
+    assert result.movies.items[9].position == 10
+    assert result.movies.items[0].detail_url == "https://www.justwatch.com/us/movie/dune"
+    [show] = result.series.items
+    assert (show.slug, show.title, show.position) == ("severance", "Severance", 1)
+    assert show.image_url == link["image"]
+
+
+async def test_detail_page_is_built_from_one_evaluate() -> None:
+    portrait = "https://images.justwatch.com/portrait/1/zendaya.webp"
+    page = FakePage(
+        {
+            "data": {"@type": "Movie", "description": "Spice.", "actor": [{"name": "Zendaya"}]},
+            "cast": {"Zendaya": portrait},
+        }
+    )
+    base = ScrapeShow(show_type=ShowType.MOVIE, title="Dune", slug="dune")
+    show = await SiteOriginJustWatch().extract_detail_page(page, base)
+
+    assert page.calls == 1
+    assert show.overview == "Spice."
+    assert [(m.name, m.image_url) for m in show.cast] == [("Zendaya", portrait)]
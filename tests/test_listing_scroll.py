@@ -0,0 +1,62 @@
+import pytest
+
+from app.core.config import settings
+from app.schemas.scrape import ScrapeShow, ScrapeShowList, ShowType
+from app.services.scraper_service import ScraperService
+from app.services.site_origins.justwatch import SiteOriginJustWatch
+from app.services.site_origins.scroll import SCROLL_BY_JS, InfiniteScroll
+
+
+class GrowingPage:
+    def __init__(self, total: int, per_scroll: int):
+        self.total = total
+        self.per_scroll = per_scroll
+        self.rendered = per_scroll
+        self.scrolls = 0
+
+    async def evaluate(self, expression: str, arg=None) -> int:
+        if expression == SCROLL_BY_JS:
+            self.scrolls += 1
+            self.rendered = min(self.total, self.rendered + self.per_scroll)
+        return self.rendered
+
+
+class ScrollingOrigin(SiteOriginJustWatch):
+    def get_listing_scroll(self) -> InfiniteScroll:
+        return InfiniteScroll("a", growth_timeout=0.05, interval=0.01)
+
+    async def extract_from_page(self, page: GrowingPage) -> ScrapeShowList:
+        # Every title is rendered twice, as in the real grid's duplicate rows.
+        shows = [
+            ScrapeShow(
+                show_type=ShowType.MOVIE,
+                title=f"Show {i}",
+                slug=f"show-{i}",
+                detail_url=f"https://example.test/show-{i}",
+            )
+            for i in range(page.rendered)
+        ]
+        return ScrapeShowList(items=shows + shows)
+
+
+@pytest.fixture
+def scraper(monkeypatch, tmp_path) -> ScraperService:
+    monkeypatch.setattr(settings, "shared_dir", tmp_path)
+    return ScraperService(llm_service=object())
+
+
+async def test_scrolls_until_max_items(scraper: ScraperService) -> None:
+    page = GrowingPage(total=100, per_scroll=4)
+    shows = [s async for s in scraper._scroll_listing(page, ScrollingOrigin(), max_items=10)]
+
+    assert [s.slug for s in shows] == [f"show-{i}" for i in range(10)]
+    assert [s.position for s in shows] == list(range(1, 11))
+    assert page.scrolls == 2
+
+
+async def test_stops_when_listing_stops_growing(scraper: ScraperService) -> None:
+    page = GrowingPage(total=9, per_scroll=4)
+    shows = [s async for s in scraper._scroll_listing(page, ScrollingOrigin(), max_items=50)]
+
+    assert len(shows) == 9
+    assert page.scrolls == 4
@@ -0,0 +1,79 @@
+import asyncio
+
+from app.enums import JobStatus, JobType
+from app.services.retry_policy import RETRY_POLICIES, RetryPolicy
+from app.workers.backends import MemoryQueueBackend
+
+
+async def test_claims_by_priority_and_skips_delayed_jobs() -> None:
+    backend = MemoryQueueBackend()
+    low = await backend.enqueue(JobType.SCRAPE_POPULAR, {"n": 1})
+    high = await backend.enqueue(JobType.SCRAPE_POPULAR, {"n": 2}, priority=5)
+    await backend.enqueue(JobType.SCRAPE_POPULAR, {"n": 3}, priority=10, delay_seconds=60)
+
+    claimed = await backend.claim_jobs("w1", 5, [JobType.SCRAPE_POPULAR])
+    assert [job.id for job in claimed] == [high.id, low.id]
+    assert all(job.status == JobStatus.PROCESSING and job.attempts == 1 for job in claimed)
+
+
+async def test_failed_jobs_retry_with_backoff_until_attempts_run_out(monkeypatch) -> None:
+    policy = RetryPolicy(base_seconds=0.01, max_seconds=0.01, jitter=0)
+    monkeypatch.setitem(RETRY_POLICIES, JobType.SCRAPE_TOP_TEN, policy)
+    backend = MemoryQueueBackend()
+    job = await backend.enqueue(JobType.SCRAPE_TOP_TEN)
+
+    for attempt in range(1, job.max_attempts + 1):
+        [claimed] = await backend.claim_jobs("w1", 1)
+        assert claimed.attempts == attempt
+        await backend.fail_job(claimed, "boom")
+        # Backed off: not claimable again until the retry delay has passed.
+        assert await backend.claim_jobs("w1", 1) == []
+        await asyncio.sleep(0.02)
+
+    failed = await backend.get_job(job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.error == "boom"
+
+
+async def test_dependents_wait_for_parents_and_dedup_skips_active_jobs() -> None:
+    backend = MemoryQueueBackend()
+    parent = await backend.enqueue(JobType.SCRAPE_TOP_TEN, dedup_key="top")
+    assert await backend.enqueue(JobType.SCRAPE_TOP_TEN, dedup_key="top") is None
+    child = await backend.enqueue(JobType.VALIDATE_AND_STORE, depends_on=[parent.id])
+    assert child.status == JobStatus.BLOCKED
+
+    [claimed] = await backend.claim_jobs("w1", 5)
+    assert claimed.id == parent.id
+    await backend.complete_job(claimed, {"ok": True})
+    assert (await backend.get_job(child.id)).status == JobStatus.PENDING
+
+
+async def test_requeue_returns_attempt_only_to_lease_holder() -> None:
+    backend = MemoryQueueBackend()
+    job = await backend.enqueue(JobType.SCRAPE_POPULAR)
+    [claimed] = await backend.claim_jobs("w1", 1)
+
+    stale = await backend.get_job(job.id)
+    stale.worker_id = "w2"
+    assert await backend.requeue_job(stale) is False
+
+    assert await backend.requeue_job(claimed) is True
+    requeued = await backend.get_job(job.id)
+    assert requeued.status == JobStatus.PENDING
+    assert requeued.attempts == 0
+    assert requeued.rank_at == claimed.rank_at
+
+
+async def test_stale_worker_cannot_finish_a_reclaimed_job() -> None:
+    backend = MemoryQueueBackend()
+    job = await backend.enqueue(JobType.SCRAPE_POPULAR)
+    [stale] = await backend.claim_jobs("w1", 1)
+    await backend.release_jobs([job.id])
+    [current] = await backend.claim_jobs("w2", 1)
+
+    await backend.complete_job(stale, {"stale": True})
+    await backend.fail_job(stale, "stale")
+    assert (await backend.get_job(job.id)).status == JobStatus.PROCESSING
+
+    await backend.complete_job(current, {"ok": True})
+    assert (await backend.get_job(job.id)).result == {"ok": True}
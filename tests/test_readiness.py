@@ -0,0 +1,32 @@
+from app.services.site_origins.readiness import ItemCountStable, wait_until_ready
+
+
+class FakeLocator:
+    def __init__(self, counts: list[int]):
+        self.counts = counts
+
+    async def count(self) -> int:
+        return self.counts.pop(0) if len(self.counts) > 1 else self.counts[0]
+
+
+class FakePage:
+    url = "https://example.test/"
+
+    def __init__(self, counts: list[int]):
+        self._locator = FakeLocator(counts)
+
+    def locator(self, selector: str) -> FakeLocator:
+        return self._locator
+
+
+async def test_item_count_waits_until_count_stops_growing() -> None:
+    page = FakePage([0, 12, 30, 30, 30])
+    readiness = ItemCountStable("a", interval=0.01)
+    await readiness.wait(page, timeout=1.0)
+    assert page._locator.counts == [30]
+
+
+async def test_unmet_readiness_is_bounded_by_timeout() -> None:
+    page = FakePage([0])
+    waited = await wait_until_ready(page, [ItemCountStable("a", interval=0.01)], timeout=0.1)
+    assert 0.1 <= waited < 0.5
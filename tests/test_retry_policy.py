@@ -0,0 +1,25 @@
+from app.core.config import settings
+from app.enums import JobType
+from app.services.retry_policy import RetryPolicy, get_retry_policy
+
+
+def test_backoff_doubles_per_attempt_and_caps() -> None:
+    policy = RetryPolicy(base_seconds=10, max_seconds=60, jitter=0)
+    assert [policy.backoff_seconds(n) for n in range(1, 6)] == [10, 20, 40, 60, 60]
+
+
+def test_delay_stays_within_jitter_window() -> None:
+    policy = RetryPolicy(base_seconds=10, max_seconds=600, jitter=0.5)
+    delays = [policy.delay_seconds(3) for _ in range(200)]
+    assert all(20 <= d <= 40 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_policies_fall_back_to_settings(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "queue_retry_base_seconds", 5.0)
+    monkeypatch.setattr(settings, "queue_retry_max_seconds", 100.0)
+
+    assert get_retry_policy(JobType.VALIDATE_AND_STORE).base_seconds == 5.0
+    assert get_retry_policy(JobType.VALIDATE_AND_STORE).max_seconds == 900
+    assert get_retry_policy(JobType.SCRAPE_POPULAR).max_seconds == 100.0
+    assert RetryPolicy(base_seconds=0).base_seconds == 0
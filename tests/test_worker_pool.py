@@ -0,0 +1,74 @@
+import asyncio
+
+from app.core.config import settings
+from app.enums import JobStatus, JobType, ResourceClass
+from app.workers.backends import MemoryQueueBackend
+from app.workers.buffer import JobBuffer
+from app.workers.manager import WorkerManager
+from app.workers.notifier import QueueNotifier
+from app.workers.pool import get_pool_sizes, get_resource_class
+from app.workers.worker import Worker
+
+
+async def test_buffered_jobs_keep_their_lease_while_waiting(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "queue_lease_seconds", 0.3)
+    monkeypatch.setattr(settings, "queue_heartbeat_interval", 0.1)
+    monkeypatch.setattr(settings, "queue_reaper_interval", 0.05)
+    monkeypatch.setattr(settings, "queue_autoscale", False)
+
+    async def slow_handler(job, session) -> dict:
+        await asyncio.sleep(0.6)
+        return {}
+
+    backend = MemoryQueueBackend()
+    manager = WorkerManager(
+        pool_sizes={ResourceClass.BROWSER: 1},
+        backend=backend,
+        handlers={JobType.SCRAPE_POPULAR: slow_handler},
+    )
+    jobs = [await backend.enqueue(JobType.SCRAPE_POPULAR, {"n": i}) for i in range(3)]
+
+    await manager.start()
+    try:
+        async with asyncio.timeout(5):
+            while manager.status()["completed"] < len(jobs):
+                await asyncio.sleep(0.05)
+    finally:
+        await manager.stop()
+
+    for job in jobs:
+        current = await backend.get_job(job.id)
+        assert (current.status, current.attempts) == (JobStatus.COMPLETED, 1)
+
+
+def test_every_job_type_has_a_sized_pool() -> None:
+    pool_sizes = get_pool_sizes()
+    assert all(get_resource_class(job_type) in pool_sizes for job_type in JobType)
+
+
+async def test_cancel_is_noticed_without_listen(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "queue_poll_interval", 0.05)
+    monkeypatch.setattr(settings, "queue_heartbeat_interval", 60)
+
+    async def slow_handler(job, session) -> dict:
+        await asyncio.sleep(5)
+        return {}
+
+    backend = MemoryQueueBackend()
+    job = await backend.enqueue(JobType.SCRAPE_POPULAR)
+    buffer = JobBuffer()
+    buffer.put_many(await backend.claim_jobs("w1", 1))
+    # Never started, so it is not listening and only polls.
+    notifier = QueueNotifier(settings.queue_cancel_channel)
+    worker = Worker(buffer, "w1", notifier, backend, {JobType.SCRAPE_POPULAR: slow_handler})
+
+    task = asyncio.create_task(worker.start())
+    await asyncio.sleep(0.1)
+    await backend.cancel_job(job.id)
+    async with asyncio.timeout(1):
+        while worker.jobs_cancelled == 0:
+            await asyncio.sleep(0.02)
+
+    worker.stop()
+    buffer.close()
+    await task